@@ -0,0 +1,182 @@
+from collections import OrderedDict, deque
+
+# Limite padrão do cache: total de vértices guardados somando todas as
+# entradas (~ 60 bytes por vértice num set, então ~ 60 MB).
+LIMITE_PADRAO = 1_000_000
+
+
+class CacheAlcance:
+    """
+    Cache de alcançabilidade sobre qualquer grafo do protocolo 'Grafo' (ver
+    grafo.py): para cada origem consultada, guarda o conjunto de vértices
+    alcançáveis a partir dela (resultado de uma BFS).
+
+    As alterações do grafo devem passar pelo cache ('inserir_aresta',
+    'remover_aresta', 'remover_vertice', ...), que as repassa ao grafo e
+    mantém as entradas corretas:
+        inserção - atualização incremental: em cada entrada que já alcança
+                   a origem da aresta, uma BFS a partir do destino acrescenta
+                   só os vértices que ainda não estavam no conjunto
+        remoção  - invalida apenas as entradas que alcançavam a origem da
+                   aresta (ou o vértice removido); as demais continuam válidas
+
+    O tamanho do cache é a soma dos tamanhos dos conjuntos guardados; ao
+    passar de 'limite', as entradas usadas há mais tempo são descartadas
+    (LRU, com um OrderedDict na ordem de uso).
+
+    Os demais atributos (consultas de leitura) são os do grafo envolvido.
+    """
+
+    def __init__(self, grafo, limite=LIMITE_PADRAO):
+        self.grafo = grafo
+        self.limite = limite
+        self.entradas = OrderedDict()
+        self.tamanho = 0
+
+    def __getattr__(self, nome):
+        return getattr(self.grafo, nome)
+
+    def __contains__(self, vertice):
+        return vertice in self.grafo
+
+    def __len__(self):
+        return len(self.grafo)
+
+    def __iter__(self):
+        return iter(self.grafo)
+
+    def _expandir(self, alcancados, inicio):
+        """
+        BFS a partir de 'inicio' que acrescenta a 'alcancados' os vértices
+        ainda não presentes, sem revisitar os que já estavam lá.
+        Retorna quantos vértices foram acrescentados.
+        """
+        if inicio in alcancados:
+            return 0
+
+        antes = len(alcancados)
+        alcancados.add(inicio)
+        fila = deque([inicio])
+        vizinhos = self.grafo.iterar_vizinhos
+
+        while fila:
+            u = fila.popleft()
+            for v in vizinhos(u):
+                if v not in alcancados:
+                    alcancados.add(v)
+                    fila.append(v)
+
+        return len(alcancados) - antes
+
+    def _respeitar_limite(self):
+        """
+        Descarta as entradas menos usadas até o cache caber em 'limite'
+        (a entrada mais recente é mantida mesmo se sozinha passar do limite).
+        """
+        while self.tamanho > self.limite and len(self.entradas) > 1:
+            _, alcancados = self.entradas.popitem(last=False)
+            self.tamanho -= len(alcancados)
+
+    def _invalidar(self, vertice):
+        """
+        Descarta as entradas cujo conjunto contém 'vertice'.
+        """
+        for origem in [o for o, alcancados in self.entradas.items() if vertice in alcancados]:
+            self.tamanho -= len(self.entradas.pop(origem))
+
+    def alcancaveis(self, origem):
+        """
+        Retorna o conjunto de vértices alcançáveis a partir de 'origem'
+        (incluindo ela; vazio se não existir), calculando-o só na primeira
+        consulta. O conjunto é o guardado no cache: não deve ser alterado.
+        """
+        alcancados = self.entradas.get(origem)
+        if alcancados is not None:
+            self.entradas.move_to_end(origem)
+            return alcancados
+
+        if origem not in self.grafo:
+            return frozenset()
+
+        alcancados = set()
+        self.tamanho += self._expandir(alcancados, origem)
+        self.entradas[origem] = alcancados
+        self._respeitar_limite()
+        return alcancados
+
+    def alcancavel(self, origem, destino):
+        """
+        Verifica se existe caminho de 'origem' até 'destino' (O(1) com a
+        entrada de 'origem' já no cache).
+        """
+        return destino in self.alcancaveis(origem)
+
+    def inserir_vertice(self, vertice):
+        """
+        Insere o vértice no grafo; nenhuma entrada muda (ninguém o alcança).
+        """
+        return self.grafo.inserir_vertice(vertice)
+
+    def inserir_aresta(self, origem, destino, nao_direcionado=False, peso=1):
+        """
+        Insere a aresta no grafo e atualiza as entradas que alcançam uma das
+        pontas (a origem, ou também o destino se não direcionado).
+        """
+        self.grafo.inserir_aresta(origem, destino, nao_direcionado, peso)
+
+        for alcancados in self.entradas.values():
+            if origem in alcancados:
+                self.tamanho += self._expandir(alcancados, destino)
+            elif nao_direcionado and destino in alcancados:
+                self.tamanho += self._expandir(alcancados, origem)
+
+        self._respeitar_limite()
+
+    def inserir_arestas(self, arestas, nao_direcionado=False):
+        """
+        Insere várias arestas no grafo e atualiza as entradas afetadas.
+        """
+        arestas = list(arestas)
+        self.grafo.inserir_arestas(arestas, nao_direcionado)
+
+        for alcancados in self.entradas.values():
+            for origem, destino, *_ in arestas:
+                if origem in alcancados:
+                    self.tamanho += self._expandir(alcancados, destino)
+                elif nao_direcionado and destino in alcancados:
+                    self.tamanho += self._expandir(alcancados, origem)
+
+        self._respeitar_limite()
+
+    def remover_aresta(self, origem, destino, nao_direcionado=False):
+        """
+        Remove a aresta do grafo e invalida as entradas que alcançavam uma
+        de suas pontas (só nelas a aresta podia fazer parte de um caminho).
+        """
+        removida = self.grafo.remover_aresta(origem, destino, nao_direcionado)
+
+        if removida:
+            self._invalidar(origem)
+            if nao_direcionado:
+                self._invalidar(destino)
+
+        return removida
+
+    def remover_vertice(self, vertice, *args, **kwargs):
+        """
+        Remove o vértice do grafo e invalida as entradas que o alcançavam.
+        """
+        removido = self.grafo.remover_vertice(vertice, *args, **kwargs)
+
+        if removido:
+            self._invalidar(vertice)
+
+        return removido
+
+    def limpar(self):
+        """
+        Descarta todas as entradas (por exemplo, depois de alterar o grafo
+        sem passar pelo cache).
+        """
+        self.entradas.clear()
+        self.tamanho = 0
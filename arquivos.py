@@ -0,0 +1,151 @@
+import csv
+import gzip
+from itertools import islice
+
+
+TAMANHO_BLOCO = 100_000
+
+CABECALHO = ("origem", "destino")
+
+
+def _separador_padrao(caminho):
+    """
+    Escolhe o separador pela extensão: TAB para .tsv (ou .tsv.gz), vírgula nos demais.
+    """
+    nome = caminho[:-3] if caminho.endswith(".gz") else caminho
+    return "\t" if nome.endswith(".tsv") else ","
+
+
+def _abrir(caminho, modo):
+    """
+    Abre o arquivo em modo texto, descompactando/compactando com gzip se terminar em .gz.
+    """
+    if caminho.endswith(".gz"):
+        return gzip.open(caminho, modo + "t", encoding="utf-8", newline="")
+    return open(caminho, modo, encoding="utf-8", newline="")
+
+
+def _sem_comentarios(arquivo):
+    """
+    Gera as linhas do arquivo, pulando as que começam com '#' (comentários).
+
+    O teste é feito na linha crua, antes do csv: um nome que começa com '#'
+    gravado por 'escrever_arestas' vem entre aspas e não é confundido com
+    comentário. (Nomes com quebra de linha seguida de '#' não são suportados.)
+    """
+    for linha in arquivo:
+        if not linha.startswith("#"):
+            yield linha
+
+
+def ler_arestas(caminho, separador=None, tamanho_bloco=TAMANHO_BLOCO, cabecalho=False):
+    """
+    Lê um arquivo de arestas ("origem,destino" por linha, CSV ou TSV,
+    opcionalmente .gz) e gera blocos de até 'tamanho_bloco' pares.
+
+    Passos:
+    1. Abrir o arquivo (gzip se necessário) e ler as linhas com o módulo csv,
+       uma de cada vez.
+    2. Ignorar linhas vazias, comentários (linhas que começam com '#') e, se
+       'cabecalho' for True, a primeira linha de dados.
+    3. Acumular pares (origem, destino) até completar um bloco e entregá-lo.
+    4. Entregar o último bloco incompleto, se houver.
+
+    Os nomes são lidos exatamente como foram gravados (sem strip), então o
+    que 'escrever_arestas' grava é lido de volta sem alteração.
+
+    Só um bloco fica em memória por vez, independente do tamanho do arquivo.
+    Uma linha com número de colunas diferente de 2 gera ValueError.
+    """
+    if separador is None:
+        separador = _separador_padrao(caminho)
+
+    with _abrir(caminho, "r") as arquivo:
+        leitor = csv.reader(_sem_comentarios(arquivo), delimiter=separador)
+        bloco = []
+
+        for linha in leitor:
+            if not linha:
+                continue
+            if cabecalho:
+                cabecalho = False
+                continue
+            if len(linha) != 2:
+                raise ValueError(f"Linha {leitor.line_num} de '{caminho}' não tem 2 colunas: {linha}")
+
+            par = (linha[0], linha[1])
+            bloco.append(par)
+            if len(bloco) >= tamanho_bloco:
+                yield bloco
+                bloco = []
+
+        if bloco:
+            yield bloco
+
+
+def carregar_arestas(caminho, grafo, nao_direcionado=False, separador=None, tamanho_bloco=TAMANHO_BLOCO,
+                     cabecalho=False):
+    """
+    Carrega um arquivo de arestas em qualquer grafo do protocolo 'Grafo'
+    (ver grafo.py), bloco a bloco, pela inserção em lote 'inserir_arestas'.
+    Retorna quantas linhas de aresta foram lidas.
+    """
+    total = 0
+
+    for bloco in ler_arestas(caminho, separador, tamanho_bloco, cabecalho):
+        grafo.inserir_arestas(bloco, nao_direcionado)
+        total += len(bloco)
+
+    return total
+
+
+def arestas_do_grafo(grafo):
+    """
+    Gera os pares (origem, destino) de todas as arestas de um grafo do protocolo 'Grafo'.
+    Usa 'iterar_vizinhos', que não monta nem guarda as vistas de 'vizinhos'.
+    """
+    for origem in grafo:
+        for destino in grafo.iterar_vizinhos(origem):
+            yield origem, destino
+
+
+def escrever_arestas(caminho, arestas, separador=None, cabecalho=False, tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Grava pares (origem, destino) em um arquivo CSV/TSV (gzip se terminar em .gz).
+
+    Passos:
+    1. Abrir o arquivo para escrita e, se pedido, gravar o cabeçalho (para
+       lê-lo de volta, passar cabecalho=True a 'ler_arestas').
+    2. Consumir 'arestas' em blocos de 'tamanho_bloco' pares, gravando cada
+       bloco com csv.writer.writerows; 'arestas' pode ser um gerador
+       (ex: 'arestas_do_grafo'), que nunca é materializado inteiro.
+    3. Retornar quantas arestas foram gravadas.
+
+    Linhas cuja origem começa com '#' são gravadas com aspas em todos os
+    campos, para que 'ler_arestas' não as tome por comentários.
+    """
+    if separador is None:
+        separador = _separador_padrao(caminho)
+
+    total = 0
+    arestas = iter(arestas)
+
+    with _abrir(caminho, "w") as arquivo:
+        escritor = csv.writer(arquivo, delimiter=separador, lineterminator="\n")
+        escritor_aspas = csv.writer(arquivo, delimiter=separador, lineterminator="\n", quoting=csv.QUOTE_ALL)
+
+        if cabecalho:
+            escritor.writerow(CABECALHO)
+
+        while True:
+            bloco = list(islice(arestas, tamanho_bloco))
+            if not bloco:
+                break
+            if any(str(origem).startswith("#") for origem, _ in bloco):
+                for aresta in bloco:
+                    (escritor_aspas if str(aresta[0]).startswith("#") else escritor).writerow(aresta)
+            else:
+                escritor.writerows(bloco)
+            total += len(bloco)
+
+    return total
@@ -0,0 +1,231 @@
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+
+from csr import GrafoCSR
+
+
+# Formato do arquivo (inteiros little-endian, seções alinhadas em 8 bytes):
+#
+#   cabeçalho      MAGICO (8 bytes), V, E, tamanho do bloco de nomes (uint64)
+#   inicio         V+1 int64   - início da fatia de vizinhos de cada vértice
+#   alvos          E   int32   - destinos, ordenados dentro de cada fatia
+#   posicoes       V+1 int64   - início do nome de cada vértice no bloco de nomes
+#   ordem          V   int32   - índices dos vértices em ordem crescente de nome
+#   nomes          nomes em UTF-8, concatenados
+MAGICO = b"GRAFCSR1"
+CABECALHO = struct.Struct("<8sQQQ")
+
+
+def _alinhar(posicao):
+    return (posicao + 7) & ~7
+
+
+def _secoes(v, e):
+    """
+    Calcula o deslocamento (em bytes) de cada seção a partir de V e E.
+    """
+    inicio = CABECALHO.size
+    alvos = _alinhar(inicio + 8 * (v + 1))
+    posicoes = _alinhar(alvos + 4 * e)
+    ordem = _alinhar(posicoes + 8 * (v + 1))
+    nomes = _alinhar(ordem + 4 * v)
+    return inicio, alvos, posicoes, ordem, nomes
+
+
+def _verificar_ordem_bytes():
+    if sys.byteorder != "little":
+        raise ValueError("O formato binário de grafos só é suportado em máquinas little-endian.")
+
+
+def salvar_binario(caminho, grafo):
+    """
+    Grava um grafo no formato binário descrito acima.
+
+    Passos:
+    1. Obter o retrato CSR do grafo ('grafo' pode ser um GrafoCSR ou qualquer
+       objeto com 'congelar()').
+    2. Codificar os nomes (str) em UTF-8 e montar a tabela de posições e a
+       ordem dos vértices por nome (usada na busca binária ao carregar).
+    3. Gravar cabeçalho e seções, preenchendo com zeros até cada alinhamento.
+    """
+    _verificar_ordem_bytes()
+    csr = grafo if isinstance(grafo, GrafoCSR) else grafo.congelar()
+
+    nomes = list(csr.nomes)
+    for nome in nomes:
+        if not isinstance(nome, str):
+            raise TypeError(f"O formato binário só aceita nomes de vértice str, não {type(nome).__name__}.")
+
+    codificados = [nome.encode("utf-8") for nome in nomes]
+    posicoes = array("q", [0])
+    for nome in codificados:
+        posicoes.append(posicoes[-1] + len(nome))
+    ordem = array("i", sorted(range(len(nomes)), key=codificados.__getitem__))
+
+    v, e = len(nomes), len(csr.alvos)
+    secoes = _secoes(v, e)
+    conteudos = (csr.inicio, csr.alvos, posicoes, ordem, b"".join(codificados))
+
+    with open(caminho, "wb") as arquivo:
+        arquivo.write(CABECALHO.pack(MAGICO, v, e, posicoes[-1]))
+        for deslocamento, conteudo in zip(secoes, conteudos):
+            arquivo.write(bytes(deslocamento - arquivo.tell()))
+            arquivo.write(conteudo)
+
+
+class _TabelaNomes:
+    """
+    Sequência somente leitura índice -> nome, decodificando cada nome do
+    bloco UTF-8 apenas quando ele é pedido.
+    """
+
+    def __init__(self, bloco, posicoes):
+        self._bloco = bloco
+        self._posicoes = posicoes
+
+    def __len__(self):
+        return len(self._posicoes) - 1
+
+    def __getitem__(self, i):
+        return self.bruto(i).decode("utf-8")
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def bruto(self, i):
+        return bytes(self._bloco[self._posicoes[i]:self._posicoes[i + 1]])
+
+
+class _IndiceNomes:
+    """
+    Mapeamento somente leitura nome -> índice, por busca binária sobre a
+    seção 'ordem' (O(log V) comparações de bytes, nenhum dicionário montado).
+    """
+
+    def __init__(self, tabela, ordem):
+        self._tabela = tabela
+        self._ordem = ordem
+
+    def get(self, nome, padrao=None):
+        if not isinstance(nome, str):
+            return padrao
+
+        chave = nome.encode("utf-8")
+        ordem, tabela = self._ordem, self._tabela
+        baixo, alto = 0, len(ordem)
+
+        while baixo < alto:
+            meio = (baixo + alto) // 2
+            if tabela.bruto(ordem[meio]) < chave:
+                baixo = meio + 1
+            else:
+                alto = meio
+
+        if baixo < len(ordem) and tabela.bruto(ordem[baixo]) == chave:
+            return ordem[baixo]
+        return padrao
+
+    def __contains__(self, nome):
+        return self.get(nome) is not None
+
+    def __getitem__(self, nome):
+        i = self.get(nome)
+        if i is None:
+            raise KeyError(nome)
+        return i
+
+
+class GrafoMapeado(GrafoCSR):
+    """
+    GrafoCSR somente leitura lido direto de um arquivo binário via mmap.
+
+    As seções do arquivo são expostas como memoryview (sem cópia): abrir o
+    arquivo custa apenas ler o cabeçalho, e as páginas são trazidas do disco
+    sob demanda pelo sistema operacional. Nomes são decodificados só quando
+    usados e a busca nome -> índice é binária sobre a seção 'ordem'.
+
+    Tem as mesmas consultas de GrafoCSR (vizinhos, existe_aresta,
+    grau_vertices no formato da lista de adjacência, ...). Use 'fechar()'
+    (ou 'with') para liberar o arquivo.
+
+    'fechar()' libera todas as visões do mmap: iteradores ainda abertos
+    (por exemplo de 'iterar_vizinhos') passam a gerar ValueError ao avançar.
+    """
+
+    def __init__(self, caminho):
+        _verificar_ordem_bytes()
+        self._mapa = self._visao = None
+        self._visoes = []
+        self._arquivo = open(caminho, "rb")
+
+        try:
+            self._mapa = mmap.mmap(self._arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+            self._visao = memoryview(self._mapa)
+            magico, v, e, tamanho_nomes = CABECALHO.unpack_from(self._visao)
+        except (ValueError, struct.error):
+            self.fechar()
+            raise ValueError(f"'{caminho}' é curto demais para ser um arquivo de grafo binário.") from None
+
+        if magico != MAGICO:
+            self.fechar()
+            raise ValueError(f"'{caminho}' não é um arquivo de grafo binário.")
+
+        inicio, alvos, posicoes, ordem, nomes = _secoes(v, e)
+        tamanho = len(self._visao)
+        if tamanho < nomes + tamanho_nomes:
+            self.fechar()
+            raise ValueError(f"'{caminho}' está truncado ({tamanho} de {nomes + tamanho_nomes} bytes).")
+
+        visao = self._visao
+        tabela = _TabelaNomes(self._mapear(visao[nomes:nomes + tamanho_nomes]),
+                              self._mapear(visao[posicoes:ordem].cast("q")[:v + 1]))
+
+        self.inicio = self._mapear(visao[inicio:alvos].cast("q")[:v + 1])
+        self.alvos = self._mapear(visao[alvos:posicoes].cast("i")[:e]) if e else array("i")
+        self.nomes = tabela
+        self.indices = _IndiceNomes(tabela, self._mapear(visao[ordem:nomes].cast("i")[:v]) if v else array("i"))
+        self._entradas = None
+        self._reversa = None
+
+    def _mapear(self, visao):
+        """
+        Registra uma visão derivada do mmap para ser liberada em 'fechar'.
+        """
+        self._visoes.append(visao)
+        return visao
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    def fechar(self):
+        """
+        Libera as visões do mmap e fecha o arquivo.
+
+        Todas as visões derivadas são liberadas explicitamente (e não só
+        descartadas), para que referências ainda vivas, como as de um
+        iterador de vizinhos em andamento, não impeçam o fechamento do mmap.
+        """
+        self.inicio = self.alvos = self.nomes = self.indices = None
+        for visao in reversed(self._visoes):
+            visao.release()
+        self._visoes = []
+
+        if self._visao is not None:
+            self._visao.release()
+        if self._mapa is not None:
+            self._mapa.close()
+        self._arquivo.close()
+
+
+def carregar_binario(caminho):
+    """
+    Abre um grafo salvo por 'salvar_binario' como GrafoMapeado (sem cópia).
+    """
+    return GrafoMapeado(caminho)
@@ -0,0 +1,251 @@
+from collections import deque
+
+
+def largura(grafo, origem):
+    """
+    Busca em largura (BFS) a partir de 'origem': gera os vértices alcançáveis
+    na ordem em que são descobertos (origem primeiro, depois a 1 salto, a 2...).
+
+    'grafo' é qualquer objeto do protocolo 'Grafo' (ver grafo.py); os vizinhos
+    vêm de 'iterar_vizinhos', sem copiar listas, então a busca é O(V + E) nas
+    listas e no CSR (O(V²) na matriz, que precisa varrer cada linha).
+    """
+    if origem not in grafo:
+        return
+
+    visitados = {origem}
+    fila = deque([origem])
+
+    while fila:
+        u = fila.popleft()
+        yield u
+        for v in grafo.iterar_vizinhos(u):
+            if v not in visitados:
+                visitados.add(v)
+                fila.append(v)
+
+
+def profundidade(grafo, origem):
+    """
+    Busca em profundidade (DFS) iterativa a partir de 'origem': gera os
+    vértices alcançáveis em pré-ordem.
+
+    Passos:
+    1. Manter uma pilha de iteradores de vizinhos (um por vértice do ramo
+       atual), em vez de recursão, para não esbarrar no limite de recursão
+       do Python em grafos grandes.
+    2. Avançar o iterador do topo: vizinho novo é visitado e empilhado;
+       iterador esgotado é desempilhado (volta ao vértice anterior).
+    """
+    if origem not in grafo:
+        return
+
+    visitados = {origem}
+    pilha = [grafo.iterar_vizinhos(origem)]
+    yield origem
+
+    while pilha:
+        for v in pilha[-1]:
+            if v not in visitados:
+                visitados.add(v)
+                yield v
+                pilha.append(grafo.iterar_vizinhos(v))
+                break
+        else:
+            pilha.pop()
+
+
+def _largura_ate(grafo, origem, destino):
+    """
+    BFS que para ao descobrir 'destino'; retorna o dicionário de
+    antecessores (vértice -> vértice de onde foi descoberto).
+    """
+    anteriores = {origem: None}
+    if origem == destino:
+        return anteriores
+
+    fila = deque([origem])
+    while fila:
+        u = fila.popleft()
+        for v in grafo.iterar_vizinhos(u):
+            if v not in anteriores:
+                anteriores[v] = u
+                if v == destino:
+                    return anteriores
+                fila.append(v)
+
+    return anteriores
+
+
+def alcancavel(grafo, origem, destino):
+    """
+    Verifica se existe caminho de 'origem' até 'destino' (um vértice sempre
+    alcança a si mesmo). A busca para assim que 'destino' é encontrado.
+    """
+    if origem not in grafo or destino not in grafo:
+        return False
+
+    return destino in _largura_ate(grafo, origem, destino)
+
+
+def distancias(grafo, origem):
+    """
+    Retorna um dicionário vértice -> número mínimo de saltos a partir de
+    'origem', apenas com os vértices alcançáveis.
+    """
+    if origem not in grafo:
+        return {}
+
+    distancia = {origem: 0}
+    fila = deque([origem])
+
+    while fila:
+        u = fila.popleft()
+        proxima = distancia[u] + 1
+        for v in grafo.iterar_vizinhos(u):
+            if v not in distancia:
+                distancia[v] = proxima
+                fila.append(v)
+
+    return distancia
+
+
+def arvore_largura(grafo, origem):
+    """
+    Retorna a árvore da BFS a partir de 'origem' como dicionário de
+    antecessores (vértice -> antecessor; a origem aponta para None).
+    Com ela, 'reconstruir_caminho' monta o menor caminho até qualquer
+    vértice alcançável sem refazer a busca.
+    """
+    if origem not in grafo:
+        return {}
+
+    anteriores = {origem: None}
+    fila = deque([origem])
+
+    while fila:
+        u = fila.popleft()
+        for v in grafo.iterar_vizinhos(u):
+            if v not in anteriores:
+                anteriores[v] = u
+                fila.append(v)
+
+    return anteriores
+
+
+def reconstruir_caminho(anteriores, destino):
+    """
+    Monta o caminho origem -> destino seguindo o dicionário de antecessores.
+    Retorna None se 'destino' não estiver na árvore.
+    """
+    if destino not in anteriores:
+        return None
+
+    caminho = []
+    v = destino
+    while v is not None:
+        caminho.append(v)
+        v = anteriores[v]
+
+    caminho.reverse()
+    return caminho
+
+
+def menor_caminho(grafo, origem, destino):
+    """
+    Retorna um caminho com o menor número de saltos de 'origem' até
+    'destino' (lista de vértices), ou None se não houver caminho.
+
+    Passos:
+    1. BFS a partir da origem, guardando o antecessor de cada vértice e
+       parando ao descobrir o destino.
+    2. Reconstruir o caminho de trás para frente pelos antecessores.
+    """
+    if origem not in grafo or destino not in grafo:
+        return None
+
+    return reconstruir_caminho(_largura_ate(grafo, origem, destino), destino)
+
+
+def _expandir_nivel(fronteira, iterar, anteriores, distancia, distancia_oposta):
+    """
+    Expande um nível inteiro de uma das buscas da BFS bidirecional.
+
+    Retorna a nova fronteira e o melhor encontro com a busca oposta neste
+    nível, como (comprimento total, vértice), ou None se não houve encontro.
+    """
+    proxima = []
+    encontro = None
+
+    for u in fronteira:
+        nivel = distancia[u] + 1
+        for v in iterar(u):
+            if v in distancia:
+                continue
+
+            distancia[v] = nivel
+            anteriores[v] = u
+            proxima.append(v)
+
+            oposta = distancia_oposta.get(v)
+            if oposta is not None and (encontro is None or nivel + oposta < encontro[0]):
+                encontro = (nivel + oposta, v)
+
+    return proxima, encontro
+
+
+def menor_caminho_bidirecional(grafo, origem, destino):
+    """
+    Retorna um caminho com o menor número de saltos de 'origem' até
+    'destino', ou None se não houver caminho, por BFS bidirecional.
+
+    Uma busca parte da origem pelos sucessores ('iterar_vizinhos') e outra
+    parte do destino pelos predecessores ('iterar_predecessores'). Com fator
+    de ramificação b e distância d, cada uma explora cerca de b^(d/2)
+    vértices, em vez dos b^d de uma BFS só a partir da origem.
+
+    Passos:
+    1. A cada rodada, expandir um nível inteiro da busca com a menor fronteira.
+    2. Ao descobrir um vértice já visitado pela busca oposta, terminar o
+       nível e ficar com o encontro de menor comprimento total (terminar o
+       nível garante que o caminho é mínimo).
+    3. Montar o caminho: origem -> encontro pelos antecessores da busca
+       direta, encontro -> destino pelos da busca reversa.
+    """
+    if origem not in grafo or destino not in grafo:
+        return None
+    if origem == destino:
+        return [origem]
+
+    anteriores_frente, distancia_frente, fronteira_frente = {origem: None}, {origem: 0}, [origem]
+    anteriores_tras, distancia_tras, fronteira_tras = {destino: None}, {destino: 0}, [destino]
+
+    while fronteira_frente and fronteira_tras:
+        if len(fronteira_frente) <= len(fronteira_tras):
+            fronteira_frente, encontro = _expandir_nivel(
+                fronteira_frente, grafo.iterar_vizinhos,
+                anteriores_frente, distancia_frente, distancia_tras)
+        else:
+            fronteira_tras, encontro = _expandir_nivel(
+                fronteira_tras, grafo.iterar_predecessores,
+                anteriores_tras, distancia_tras, distancia_frente)
+
+        if encontro is not None:
+            meio = encontro[1]
+            caminho = reconstruir_caminho(anteriores_frente, meio)
+            v = anteriores_tras[meio]
+            while v is not None:
+                caminho.append(v)
+                v = anteriores_tras[v]
+            return caminho
+
+    return None
+
+
+def distancia_bidirecional(grafo, origem, destino):
+    """
+    Retorna o número mínimo de saltos de 'origem' até 'destino' (BFS
+    bidirecional), ou None se 'destino' não for alcançável.
+    """
+    caminho = menor_caminho_bidirecional(grafo, origem, destino)
+    return None if caminho is None else len(caminho) - 1
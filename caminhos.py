@@ -0,0 +1,114 @@
+from heapq import heappop, heappush
+from itertools import count
+
+from busca import reconstruir_caminho
+
+
+def dijkstra(grafo, origem, destino=None):
+    """
+    Calcula as menores distâncias ponderadas a partir de 'origem'.
+
+    Retorna (distancia, anteriores): 'distancia' mapeia cada vértice
+    alcançável ao custo mínimo e 'anteriores' é a árvore de caminhos
+    mínimos (use 'reconstruir_caminho' de busca.py). Se 'destino' for
+    informado, a busca para quando ele sai da fila (sua distância já é
+    final; as dos demais vértices podem ser apenas estimativas).
+
+    Passos:
+    1. Fila de prioridade (heapq) com entradas (distância, contador,
+       vértice); o contador desempata sem comparar nomes.
+    2. Retirar a menor entrada; se ela estiver desatualizada (distância
+       maior que a registrada para o vértice), descartá-la. É a remoção
+       preguiçosa: quando a distância de um vértice melhora, a entrada
+       antiga fica no heap em vez de ter a chave diminuída.
+    3. Relaxar as arestas do vértice retirado: cada vizinho cuja distância
+       melhorou ganha uma nova entrada na fila.
+
+    Custo O((V + E) log V). Pesos negativos geram ValueError.
+    """
+    if origem not in grafo:
+        return {}, {}
+
+    distancia = {origem: 0}
+    anteriores = {origem: None}
+    ordem = count()
+    fila = [(0, next(ordem), origem)]
+    vizinhos, obter = grafo.iterar_vizinhos_ponderados, distancia.get
+
+    while fila:
+        du, _, u = heappop(fila)
+        if du > distancia[u]:
+            continue
+        if u == destino:
+            break
+
+        for v, peso in vizinhos(u):
+            if peso < 0:
+                raise ValueError(f"Aresta {u} -> {v} com peso negativo ({peso}).")
+            dv = du + peso
+            atual = obter(v)
+            if atual is None or dv < atual:
+                distancia[v] = dv
+                anteriores[v] = u
+                heappush(fila, (dv, next(ordem), v))
+
+    return distancia, anteriores
+
+
+def menor_caminho_ponderado(grafo, origem, destino):
+    """
+    Retorna (custo, caminho) do caminho de menor peso total de 'origem'
+    até 'destino', ou None se não houver caminho (Dijkstra com parada antecipada).
+    """
+    if destino not in grafo:
+        return None
+
+    distancia, anteriores = dijkstra(grafo, origem, destino)
+    if destino not in distancia:
+        return None
+
+    return distancia[destino], reconstruir_caminho(anteriores, destino)
+
+
+def a_estrela(grafo, origem, destino, heuristica):
+    """
+    Busca A*: retorna (custo, caminho) do caminho de menor peso de 'origem'
+    até 'destino', ou None se não houver caminho.
+
+    'heuristica(v)' estima o custo restante de v até 'destino'. Com uma
+    heurística admissível (nunca maior que o custo real), o resultado é
+    ótimo; com
+    heuristica = lambda v: 0 o A* é exatamente o Dijkstra com parada.
+
+    Passos:
+    1. Mesma fila de 'dijkstra' (com remoção preguiçosa), mas ordenada por
+       distância + heurística.
+    2. Ao retirar o destino, reconstruir o caminho pelos antecessores.
+    """
+    if origem not in grafo or destino not in grafo:
+        return None
+
+    distancia = {origem: 0}
+    anteriores = {origem: None}
+    ordem = count()
+    fila = [(heuristica(origem), next(ordem), 0, origem)]
+    vizinhos, obter = grafo.iterar_vizinhos_ponderados, distancia.get
+
+    while fila:
+        _, _, du, u = heappop(fila)
+        if du > distancia[u]:
+            continue
+        if u == destino:
+            return du, reconstruir_caminho(anteriores, destino)
+
+        for v, peso in vizinhos(u):
+            if peso < 0:
+                raise ValueError(f"Aresta {u} -> {v} com peso negativo ({peso}).")
+            dv = du + peso
+            atual = obter(v)
+            if atual is None or dv < atual:
+                distancia[v] = dv
+                anteriores[v] = u
+                heappush(fila, (dv + heuristica(v), next(ordem), dv, v))
+
+    return None
@@ -0,0 +1,234 @@
+from internador import Internador
+
+
+class UniaoBusca:
+    """
+    Componentes conexos de um grafo não direcionado por união-busca
+    (union-find), atualizados a cada aresta inserida.
+
+    Os vértices são internados em ids (ver internador.py); 'pai[i]' é o id
+    do pai de i na floresta e 'tamanho[i]' o tamanho da árvore de i (válido
+    só nas raízes). Com união por tamanho e compressão de caminho (por
+    halving, sem recursão), cada operação custa praticamente O(1)
+    amortizado, então montar os componentes custa O(V + E).
+
+    'inserir_vertice' e 'inserir_aresta' têm a mesma assinatura das classes
+    de grafo: chamando-as junto com as do grafo, os componentes ficam
+    sempre atualizados. Remoções não são suportadas pela união-busca; depois
+    de 'remover_vertice' ou 'remover_aresta', recalcular com
+    'componentes_conexos'.
+    """
+
+    def __init__(self):
+        self.vertices = Internador()
+        self.pai = []
+        self.tamanho = []
+        self.quantidade = 0
+
+    def __contains__(self, vertice):
+        return vertice in self.vertices
+
+    def __len__(self):
+        return len(self.vertices)
+
+    def _internar(self, vertice):
+        """
+        Retorna o id de 'vertice', criando-o como componente isolado se for novo.
+        """
+        i = self.vertices.get(vertice)
+        if i is None:
+            i = self.vertices.internar(vertice)
+            self.pai.append(i)
+            self.tamanho.append(1)
+            self.quantidade += 1
+        return i
+
+    def _raiz(self, i):
+        """
+        Retorna a raiz da árvore de 'i', apontando cada nó visitado para o
+        avô (halving) para encurtar as próximas buscas.
+        """
+        pai = self.pai
+        while pai[i] != i:
+            pai[i] = pai[pai[i]]
+            i = pai[i]
+        return i
+
+    def inserir_vertice(self, vertice):
+        """
+        Adiciona 'vertice' como um componente isolado (False se já existir).
+        """
+        if vertice in self.vertices:
+            return False
+
+        self._internar(vertice)
+        return True
+
+    def inserir_aresta(self, origem, destino, nao_direcionado=True, peso=1):
+        """
+        Une os componentes de 'origem' e 'destino' (a árvore menor passa a
+        apontar para a raiz da maior). 'nao_direcionado' e 'peso' existem só
+        para manter a assinatura do grafo: toda aresta liga os dois lados.
+        Retorna True se dois componentes diferentes foram unidos.
+        """
+        a = self._raiz(self._internar(origem))
+        b = self._raiz(self._internar(destino))
+        if a == b:
+            return False
+
+        if self.tamanho[a] < self.tamanho[b]:
+            a, b = b, a
+
+        self.pai[b] = a
+        self.tamanho[a] += self.tamanho[b]
+        self.quantidade -= 1
+        return True
+
+    def inserir_arestas(self, arestas, nao_direcionado=True):
+        """
+        Une os componentes de várias arestas de uma vez.
+        Cada aresta é (origem, destino) ou (origem, destino, peso).
+        """
+        for origem, destino, *_ in arestas:
+            self.inserir_aresta(origem, destino)
+
+    def representante(self, vertice):
+        """
+        Retorna o vértice que representa o componente de 'vertice' (a raiz
+        da sua árvore), ou None se o vértice não existir.
+        """
+        i = self.vertices.get(vertice)
+        if i is None:
+            return None
+
+        return self.vertices.nome(self._raiz(i))
+
+    def conectados(self, origem, destino):
+        """
+        Verifica se 'origem' e 'destino' estão no mesmo componente.
+        """
+        i = self.vertices.get(origem)
+        j = self.vertices.get(destino)
+        if i is None or j is None:
+            return False
+
+        return self._raiz(i) == self._raiz(j)
+
+    def tamanho_componente(self, vertice):
+        """
+        Retorna quantos vértices há no componente de 'vertice' (0 se não existir).
+        """
+        i = self.vertices.get(vertice)
+        if i is None:
+            return 0
+
+        return self.tamanho[self._raiz(i)]
+
+    def numero_componentes(self):
+        """
+        Retorna o número de componentes conexos em O(1).
+        """
+        return self.quantidade
+
+    def componentes(self):
+        """
+        Retorna a lista de componentes, cada um como lista de vértices na
+        ordem de inserção.
+        """
+        grupos = {}
+        for nome, i in self.vertices.ids.items():
+            grupos.setdefault(self._raiz(i), []).append(nome)
+
+        return list(grupos.values())
+
+
+def componentes_conexos(grafo):
+    """
+    Monta a 'UniaoBusca' de 'grafo' (qualquer objeto do protocolo 'Grafo',
+    ver grafo.py) tratando cada aresta como não direcionada, em O(V + E).
+
+    Para um grafo direcionado o resultado são os componentes fracamente
+    conexos. O objeto retornado pode continuar recebendo 'inserir_aresta'.
+    """
+    uniao = UniaoBusca()
+
+    for vertice in grafo:
+        uniao.inserir_vertice(vertice)
+
+    for vertice in grafo:
+        for vizinho in grafo.iterar_vizinhos(vertice):
+            uniao.inserir_aresta(vertice, vizinho)
+
+    return uniao
+
+
+def componentes_fortemente_conexos(grafo):
+    """
+    Retorna os componentes fortemente conexos de 'grafo' (direcionado) como
+    lista de listas de vértices, pelo algoritmo de Tarjan em O(V + E).
+
+    Os componentes saem em ordem topológica reversa: nenhuma aresta vai de
+    um componente para outro que apareça depois dele na lista.
+
+    Passos:
+    1. Numerar os vértices na ordem de descoberta de uma DFS ('indice') e
+       guardar o menor número alcançável pela subárvore sem sair dos
+       vértices ainda abertos ('baixo').
+    2. A DFS é iterativa: uma pilha de (vértice, iterador de vizinhos)
+       substitui a recursão, então não há limite de recursão em grafos
+       com milhões de vértices.
+    3. Ao terminar um vértice com baixo == indice, ele é a raiz de um
+       componente: desempilhar os vértices abertos até ele.
+    """
+    indice = {}
+    baixo = {}
+    abertos = []
+    em_aberto = set()
+    componentes = []
+
+    for raiz in grafo:
+        if raiz in indice:
+            continue
+
+        indice[raiz] = baixo[raiz] = len(indice)
+        abertos.append(raiz)
+        em_aberto.add(raiz)
+        pilha = [(raiz, iter(grafo.iterar_vizinhos(raiz)))]
+
+        while pilha:
+            v, vizinhos = pilha[-1]
+            for w in vizinhos:
+                if w not in indice:
+                    indice[w] = baixo[w] = len(indice)
+                    abertos.append(w)
+                    em_aberto.add(w)
+                    pilha.append((w, iter(grafo.iterar_vizinhos(w))))
+                    break
+                if w in em_aberto and indice[w] < baixo[v]:
+                    baixo[v] = indice[w]
+            else:
+                pilha.pop()
+                if pilha:
+                    u = pilha[-1][0]
+                    if baixo[v] < baixo[u]:
+                        baixo[u] = baixo[v]
+
+                if baixo[v] == indice[v]:
+                    componente = []
+                    while True:
+                        w = abertos.pop()
+                        em_aberto.discard(w)
+                        componente.append(w)
+                        if w == v:
+                            break
+                    componentes.append(componente)
+
+    return componentes
+
+
+def fortemente_conexo(grafo):
+    """
+    Verifica se todo vértice alcança todos os outros (um único componente
+    fortemente conexo). Um grafo vazio é considerado fortemente conexo.
+    """
+    return len(componentes_fortemente_conexos(grafo)) <= 1
@@ -0,0 +1,270 @@
+from array import array
+from bisect import bisect_left
+
+from percursos import validar_caminhos
+
+
+class GrafoCSR:
+    """
+    Grafo imutável em formato CSR (compressed sparse row).
+
+    Toda a estrutura fica em dois vetores planos:
+        inicio - array('q') com V+1 posições; os vizinhos do vértice i estão
+                 em alvos[inicio[i]:inicio[i+1]]
+        alvos  - array('i') com os índices dos destinos de todas as arestas,
+                 ordenados dentro de cada vértice
+
+    Cada aresta ocupa 4 bytes (10 milhões de arestas ~ 40 MB, mais 8 bytes por
+    vértice), a iteração de vizinhos é uma fatia contígua e 'existe_aresta' é
+    uma busca binária dentro da fatia. Os nomes ficam em 'nomes' (índice ->
+    nome) e 'indices' (nome -> índice).
+
+    É um retrato somente leitura: não há operações de inserção ou remoção.
+    Para alterar o grafo, altere a estrutura original e congele de novo.
+    """
+
+    def __init__(self, nomes, inicio, alvos):
+        self.nomes = nomes
+        self.indices = {nome: i for i, nome in enumerate(nomes)}
+        self.inicio = inicio
+        self.alvos = alvos
+        self._entradas = None
+        self._reversa = None
+
+    def __contains__(self, vertice):
+        return vertice in self.indices
+
+    def __len__(self):
+        return len(self.nomes)
+
+    def __iter__(self):
+        return iter(self.nomes)
+
+    def numero_arestas(self):
+        """
+        Retorna o total de arestas do grafo.
+        """
+        return len(self.alvos)
+
+    def existe_aresta(self, origem, destino):
+        """
+        Verifica se existe a aresta origem -> destino, por busca binária na
+        fatia (ordenada) de vizinhos da origem.
+        """
+        i = self.indices.get(origem)
+        j = self.indices.get(destino)
+        if i is None or j is None:
+            return False
+
+        fim = self.inicio[i + 1]
+        k = bisect_left(self.alvos, j, self.inicio[i], fim)
+        return k < fim and self.alvos[k] == j
+
+    def vizinhos(self, vertice):
+        """
+        Retorna a lista de vizinhos de 'vertice' (em ordem de índice).
+        """
+        i = self.indices.get(vertice)
+        if i is None:
+            return []
+
+        nomes = self.nomes
+        return [nomes[j] for j in self.alvos[self.inicio[i]:self.inicio[i + 1]]]
+
+    def iterar_vizinhos(self, vertice):
+        """
+        Gera os vizinhos de 'vertice' um a um, percorrendo sua fatia de 'alvos'.
+        """
+        i = self.indices.get(vertice)
+        if i is None:
+            return
+
+        nomes, alvos = self.nomes, self.alvos
+        for k in range(self.inicio[i], self.inicio[i + 1]):
+            yield nomes[alvos[k]]
+
+    def _transposta(self):
+        """
+        Retorna (inicio, origens): o CSR do grafo transposto, em que as
+        origens das arestas que chegam em j estão em origens[inicio[j]:inicio[j+1]].
+        Montado na primeira chamada (ordenação por contagem, O(V + E)).
+        """
+        if self._reversa is None:
+            inicio, alvos = self.inicio, self.alvos
+            origens = array('i', bytes(4 * len(alvos)))
+            for i in range(len(inicio) - 1):
+                origens[inicio[i]:inicio[i + 1]] = array('i', [i]) * (inicio[i + 1] - inicio[i])
+            self._reversa = _agrupar_por_origem(len(inicio) - 1, alvos, origens)
+
+        return self._reversa
+
+    def iterar_predecessores(self, vertice):
+        """
+        Gera os vértices com aresta chegando em 'vertice', pelo CSR transposto.
+        """
+        j = self.indices.get(vertice)
+        if j is None:
+            return
+
+        inicio, origens = self._transposta()
+        nomes = self.nomes
+        for k in range(inicio[j], inicio[j + 1]):
+            yield nomes[origens[k]]
+
+    def peso(self, origem, destino):
+        """
+        Retorna 1 se a aresta existir (o retrato CSR não guarda pesos), ou None.
+        """
+        return 1 if self.existe_aresta(origem, destino) else None
+
+    def iterar_vizinhos_ponderados(self, vertice):
+        """
+        Gera os pares (vizinho, 1): o retrato CSR não guarda pesos.
+        """
+        for destino in self.iterar_vizinhos(vertice):
+            yield destino, 1
+
+    def grau_saida(self, vertice):
+        """
+        Retorna o grau de saída de 'vertice' (tamanho da sua fatia).
+        """
+        i = self.indices.get(vertice)
+        return 0 if i is None else self.inicio[i + 1] - self.inicio[i]
+
+    def grau_entrada(self, vertice):
+        """
+        Retorna o grau de entrada de 'vertice'. As entradas de todos os
+        vértices são contadas de uma vez, na primeira chamada.
+        """
+        i = self.indices.get(vertice)
+        if i is None:
+            return 0
+
+        if self._entradas is None:
+            entradas = array('q', bytes(8 * len(self.nomes)))
+            for j in self.alvos:
+                entradas[j] += 1
+            self._entradas = entradas
+
+        return self._entradas[i]
+
+    def grau_vertices(self, nao_direcionado=False):
+        """
+        Calcula o grau (out, in, total) de cada vértice, no formato das listas.
+        Se nao_direcionado=True, retorna apenas o grau de saída de cada vértice.
+        """
+        graus = {}
+        for v in self.nomes:
+            saida = self.grau_saida(v)
+            if nao_direcionado:
+                graus[v] = saida
+            else:
+                entrada = self.grau_entrada(v)
+                graus[v] = {'in': entrada, 'out': saida, 'total': entrada + saida}
+
+        return graus
+
+    def percurso_valido(self, caminho):
+        """
+        Verifica se uma sequência de vértices (caminho) é válida.
+        """
+        for i in range(len(caminho) - 1):
+            if not self.existe_aresta(caminho[i], caminho[i + 1]):
+                return False
+
+        return True
+
+    def percursos_validos(self, caminhos):
+        """
+        Verifica muitos percursos de uma vez: cada nome é traduzido e cada
+        salto distinto é procurado (busca binária na fatia) uma única vez.
+        """
+        inicio, alvos = self.inicio, self.alvos
+
+        def existentes(saltos):
+            resultado = set()
+            for i, j in saltos:
+                fim = inicio[i + 1]
+                k = bisect_left(alvos, j, inicio[i], fim)
+                if k < fim and alvos[k] == j:
+                    resultado.add((i, j))
+            return resultado
+
+        return validar_caminhos(caminhos, self.indices, existentes)
+
+    def exibir_grafo(self):
+        """
+        Exibe o grafo em forma de lista de adjacência.
+        """
+        if not self.nomes:
+            print("O grafo está vazio.")
+            return
+
+        for vertice in sorted(self.nomes):
+            lista_vizinhos_str = ", ".join(map(str, self.vizinhos(vertice)))
+            print(f"  {vertice} -> [ {lista_vizinhos_str} ]")
+
+
+def construir_csr(nomes, listas_vizinhos):
+    """
+    Monta um GrafoCSR a partir das listas de vizinhos de cada vértice.
+
+    Passos:
+    1. 'nomes' é a lista de vértices (índice -> nome).
+    2. 'listas_vizinhos' produz, na mesma ordem de 'nomes', um iterável com
+       os índices dos vizinhos de cada vértice.
+    3. Para cada vértice, anexar seus vizinhos ordenados em 'alvos' e
+       registrar em 'inicio' onde a fatia seguinte começa.
+    """
+    inicio = array('q', [0])
+    alvos = array('i')
+
+    for lista in listas_vizinhos:
+        alvos.extend(sorted(lista))
+        inicio.append(len(alvos))
+
+    return GrafoCSR(list(nomes), inicio, alvos)
+
+
+def _agrupar_por_origem(n, origens, destinos):
+    """
+    Ordenação por contagem de duas sequências paralelas de índices
+    (origens[k] -> destinos[k]); retorna os vetores (inicio, alvos) do CSR.
+
+    Passos:
+    1. Contar quantas arestas saem de cada vértice e acumular as contagens
+       em 'inicio'.
+    2. Copiar cada destino para a próxima posição livre da fatia da origem.
+    3. Ordenar cada fatia.
+    """
+    inicio = array('q', bytes(8 * (n + 1)))
+
+    for o in origens:
+        inicio[o + 1] += 1
+
+    for i in range(n):
+        inicio[i + 1] += inicio[i]
+
+    alvos = array('i', bytes(4 * inicio[n]))
+    proxima = array('q', inicio)
+
+    for o, d in zip(origens, destinos):
+        alvos[proxima[o]] = d
+        proxima[o] += 1
+
+    for i in range(n):
+        a, b = inicio[i], inicio[i + 1]
+        if b - a > 1:
+            alvos[a:b] = array('i', sorted(alvos[a:b]))
+
+    return inicio, alvos
+
+
+def construir_csr_de_pares(nomes, origens, destinos):
+    """
+    Monta um GrafoCSR a partir de duas sequências paralelas de índices
+    (origens[k] -> destinos[k]), sem criar uma lista por vértice
+    (ordenação por contagem, ver '_agrupar_por_origem').
+    """
+    inicio, alvos = _agrupar_por_origem(len(nomes), origens, destinos)
+    return GrafoCSR(list(nomes), inicio, alvos)
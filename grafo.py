@@ -0,0 +1,129 @@
+from typing import Protocol
+
+from listadeadjacencia import AdjacenciaIndexada
+from listadearesta import ArestasIndexadas
+from matriz import MatrizBits
+
+
+class Grafo(Protocol):
+    """
+    Interface comum às classes de grafo dos três módulos:
+
+        matriz.MatrizAdjacencia, matriz.MatrizBits   (matriz de adjacência)
+        listadeadjacencia.AdjacenciaIndexada         (lista de adjacência)
+        listadearesta.ArestasIndexadas               (lista de arestas)
+
+    Todas recebem apenas os nomes dos vértices (a estrutura interna fica
+    dentro do objeto), então o mesmo código funciona com qualquer uma delas.
+
+    'grau_vertices' retorna o mesmo formato em todas as classes: vértice ->
+    {'in', 'out', 'total'} (ou só o grau de saída, com nao_direcionado=True).
+    As funções soltas de matriz.py e o seu 'main()' continuam usando as
+    chaves "saida"/"entrada".
+
+    Toda aresta tem um peso (1 se não informado em 'inserir_aresta' ou como
+    terceiro elemento em 'inserir_arestas'), lido por 'peso' e
+    'iterar_vizinhos_ponderados' (ver caminhos.py). 'congelar' descarta os pesos.
+
+    'vizinhos' retorna uma tupla guardada até a próxima alteração dos
+    vizinhos do vértice (ver vistas.py): chamadas repetidas custam O(1).
+    """
+
+    def __contains__(self, vertice): ...
+
+    def __len__(self): ...
+
+    def __iter__(self): ...
+
+    def inserir_vertice(self, vertice): ...
+
+    def inserir_aresta(self, origem, destino, nao_direcionado=False, peso=1): ...
+
+    def inserir_arestas(self, arestas, nao_direcionado=False): ...
+
+    def remover_vertice(self, vertice): ...
+
+    def remover_aresta(self, origem, destino, nao_direcionado=False): ...
+
+    def existe_aresta(self, origem, destino): ...
+
+    def vizinhos(self, vertice): ...
+
+    def iterar_vizinhos(self, vertice): ...
+
+    def iterar_predecessores(self, vertice): ...
+
+    def peso(self, origem, destino): ...
+
+    def iterar_vizinhos_ponderados(self, vertice): ...
+
+    def grau_saida(self, vertice): ...
+
+    def grau_entrada(self, vertice): ...
+
+    def grau_vertices(self, nao_direcionado=False): ...
+
+    def percurso_valido(self, caminho): ...
+
+    def percursos_validos(self, caminhos): ...
+
+    def exibir_grafo(self): ...
+
+    def congelar(self): ...
+
+
+REPRESENTACOES = {
+    "matriz": MatrizBits,
+    "adjacencia": AdjacenciaIndexada,
+    "arestas": ArestasIndexadas,
+}
+
+# Acima desta densidade (E / V²) a matriz de bits gasta menos memória que
+# as listas (2 bits por célula, linha + coluna, contra ~100 bytes por aresta em
+# dicionários).
+DENSIDADE_MATRIZ = 0.01
+
+# Limite de vértices para a matriz: 2 * V² bits (linhas + colunas) ~ 256 MB.
+MAXIMO_VERTICES_MATRIZ = 32768
+
+
+def escolher_representacao(vertices_esperados, arestas_esperadas, consultas="misto"):
+    """
+    Escolhe a representação mais adequada para a carga de trabalho.
+
+    'consultas' descreve o tipo de operação mais frequente:
+        "existencia" - existe_aresta / percurso_valido
+        "vizinhos"   - vizinhos / percursos em largura ou profundidade
+        "arestas"    - inserções e remoções de arestas com poucas consultas
+        "misto"      - sem predominância
+
+    Passos:
+    1. Se a matriz couber no limite de memória e o grafo for denso
+       (densidade >= DENSIDADE_MATRIZ), usar "matriz". Consultas de
+       existência não mudam a escolha: nas listas elas também custam O(1)
+       (busca em dicionário), e num grafo esparso a matriz só gastaria mais
+       memória.
+    2. Se as consultas forem sobre arestas, usar "arestas".
+    3. Caso contrário (grafo esparso), usar "adjacencia".
+    4. Retornar o nome da representação (chave de REPRESENTACOES).
+    """
+    if consultas not in ("existencia", "vizinhos", "arestas", "misto"):
+        raise ValueError(f"Tipo de consulta desconhecido: '{consultas}'.")
+
+    if 0 < vertices_esperados <= MAXIMO_VERTICES_MATRIZ:
+        densidade = arestas_esperadas / (vertices_esperados * vertices_esperados)
+        if densidade >= DENSIDADE_MATRIZ:
+            return "matriz"
+
+    if consultas == "arestas":
+        return "arestas"
+
+    return "adjacencia"
+
+
+def novo_grafo(vertices_esperados=0, arestas_esperadas=0, consultas="misto"):
+    """
+    Cria um grafo vazio com a representação escolhida por 'escolher_representacao'.
+    """
+    nome = escolher_representacao(vertices_esperados, arestas_esperadas, consultas)
+    return REPRESENTACOES[nome]()
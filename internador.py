@@ -0,0 +1,93 @@
+class Internador:
+    """
+    Tabela de internamento de vértices: associa cada nome a um inteiro
+    denso (id) e permite voltar do id para o nome.
+
+    As estruturas internas dos grafos guardam apenas ids (listas indexadas
+    por id, tuplas de inteiros, array('i')), e os nomes só aparecem na
+    entrada e na saída das operações.
+
+    Ids liberados por 'liberar' são reaproveitados pelos próximos
+    'internar', para que os ids continuem densos (0 .. capacidade-1).
+    A iteração percorre os nomes vivos na ordem de inserção.
+    """
+
+    def __init__(self):
+        self.ids = {}
+        self.nomes = []
+        self._livres = []
+
+    def __contains__(self, nome):
+        return nome in self.ids
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __iter__(self):
+        return iter(self.ids)
+
+    def __getitem__(self, nome):
+        return self.ids[nome]
+
+    def get(self, nome, padrao=None):
+        """
+        Retorna o id de 'nome', ou 'padrao' se o nome não estiver internado.
+        """
+        return self.ids.get(nome, padrao)
+
+    def capacidade(self):
+        """
+        Retorna quantos ids já foram criados (vivos ou livres); estruturas
+        indexadas por id precisam ter esse tamanho.
+        """
+        return len(self.nomes)
+
+    def internar(self, nome):
+        """
+        Retorna o id de 'nome', criando um novo (ou reaproveitando um livre) se necessário.
+        """
+        i = self.ids.get(nome)
+        if i is not None:
+            return i
+
+        if self._livres:
+            i = self._livres.pop()
+            self.nomes[i] = nome
+        else:
+            i = len(self.nomes)
+            self.nomes.append(nome)
+
+        self.ids[nome] = i
+        return i
+
+    def nome(self, i):
+        """
+        Retorna o nome associado ao id 'i'.
+        """
+        return self.nomes[i]
+
+    def liberar(self, nome):
+        """
+        Remove 'nome' da tabela e devolve seu id (que fica livre para reuso),
+        ou None se o nome não estiver internado.
+        """
+        i = self.ids.pop(nome, None)
+        if i is not None:
+            self.nomes[i] = None
+            self._livres.append(i)
+        return i
+
+    def compactar(self):
+        """
+        Retorna (nomes, novo_id) para numerar os vértices vivos de 0 a V-1 na
+        ordem de inserção: 'nomes' é a lista de nomes e 'novo_id' mapeia cada
+        id atual para a nova posição (None nos ids livres).
+        """
+        novo_id = [None] * len(self.nomes)
+        nomes = []
+
+        for nome, i in self.ids.items():
+            novo_id[i] = len(nomes)
+            nomes.append(nome)
+
+        return nomes, novo_id
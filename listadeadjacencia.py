@@ -1,3 +1,9 @@
+from csr import construir_csr
+from internador import Internador
+from percursos import validar_caminhos
+from vistas import VistasVizinhos
+
+
 def criar_grafo():
     """
     Retorna um novo grafo vazio.
@@ -42,6 +48,35 @@ def inserir_aresta(grafo, origem, destino, nao_direcionado=False):
             grafo[destino].append(origem)
 
 
+def inserir_arestas(grafo, arestas, nao_direcionado=False):
+    """
+    Adiciona várias arestas (pares origem, destino) de uma só vez.
+
+    Passos:
+    1. Para cada vértice tocado, criar uma única vez um conjunto com os
+       vizinhos que ele já tem (em vez de 'destino not in grafo[origem]',
+       que percorre a lista a cada aresta).
+    2. Para cada aresta nova (e a inversa, se nao_direcionado=True),
+       adicionar no conjunto e no final da lista.
+    """
+    vistos = {}
+
+    def adicionar(origem, destino):
+        conjunto = vistos.get(origem)
+        if conjunto is None:
+            inserir_vertice(grafo, origem)
+            conjunto = vistos[origem] = set(grafo[origem])
+        if destino not in conjunto:
+            conjunto.add(destino)
+            grafo[origem].append(destino)
+
+    for origem, destino in arestas:
+        inserir_vertice(grafo, destino)
+        adicionar(origem, destino)
+        if nao_direcionado:
+            adicionar(destino, origem)
+
+
 def vizinhos(grafo, vertice):
     """
     Retorna a lista de vizinhos de 'vertice'.
@@ -144,11 +179,10 @@ def grau_vertices(grafo):
     Passos:
     1. Inicializar um dict de graus vazia
     2. Para cada vertice, colocar no dict uma estrutura com in, out e total zerado
-    3. Para cada u em grafo:
+    3. Para cada u em grafo (uma única passada, O(V+E)):
           - out_degree[u] = tamanho de vizinhos
-          - para cada v em grafo:
-             - verificar se u está na lista de vizinho de v,
-             - caso esteja, adicionar +1 para o grau de entrada de u
+          - para cada v na lista de vizinhos de u:
+             - adicionar +1 para o grau de entrada de v
     4. Calcular o grau total somando entrada + saida
     5. Retornar uma estrutura contendo out,in,total por vértice (ex: dict de dicts).
     """
@@ -156,9 +190,9 @@ def grau_vertices(grafo):
 
     for u in grafo:
         graus[u]['out'] = len(grafo[u])
-        for v in grafo:
-            if u in grafo[v]:
-                graus[u]['in'] += 1
+        for v in grafo[u]:
+            if v in graus:
+                graus[v]['in'] += 1
 
     for v in graus:
         graus[v]['total'] = graus[v]['in'] + graus[v]['out']
@@ -190,6 +224,340 @@ def percurso_valido(grafo, caminho):
     return True
 
 
+def percursos_validos(grafo, caminhos):
+    """
+    Verifica muitos percursos de uma vez e retorna uma lista de bool.
+
+    Passos:
+    1. Juntar os saltos distintos de todos os caminhos ('validar_caminhos',
+       em percursos.py); os próprios nomes servem de chave.
+    2. Para cada origem, transformar sua lista de vizinhos em conjunto uma
+       única vez e consultar nele todos os saltos que saem dela.
+    """
+    def existentes(saltos):
+        conjuntos = {}
+        resultado = set()
+
+        for origem, destino in saltos:
+            conjunto = conjuntos.get(origem)
+            if conjunto is None:
+                conjunto = conjuntos[origem] = set(grafo.get(origem, ()))
+            if destino in conjunto:
+                resultado.add((origem, destino))
+
+        return resultado
+
+    return validar_caminhos(caminhos, None, existentes)
+
+
+def congelar(grafo):
+    """
+    Converte o dicionário de listas em um GrafoCSR imutável (ver csr.py).
+
+    Passos:
+    1. Numerar os vértices na ordem das chaves do dicionário.
+    2. Traduzir cada lista de vizinhos para índices e montar o CSR.
+    """
+    indices = {v: i for i, v in enumerate(grafo)}
+    return construir_csr(list(grafo), ([indices[d] for d in grafo[v]] for v in grafo))
+
+
+class AdjacenciaIndexada:
+    """
+    Lista de adjacência com conjuntos ordenados e mapa de predecessores.
+
+    Os vértices são internados em ids inteiros ('vertices', ver
+    internador.py) e toda a estrutura interna usa apenas esses ids:
+    'sucessores[i]' é um dicionário ordenado pela inserção (destino -> peso
+    da aresta, 1 se não informado) em vez de uma lista, então inserir,
+    verificar e remover uma aresta custam O(1). 'predecessores[i]' guarda, da mesma
+    forma, os vértices que têm aresta chegando em i; assim 'remover_vertice'
+    só visita os vizinhos de entrada do vértice, em vez de todas as listas
+    do grafo. Os nomes só aparecem na entrada e na saída dos métodos.
+
+    Os tamanhos de 'sucessores[i]' e 'predecessores[i]' funcionam como
+    contadores de grau mantidos a cada inserção/remoção: 'grau_saida' e
+    'grau_entrada' custam O(1) e 'grau_vertices' custa O(V).
+    """
+
+    def __init__(self):
+        self.vertices = Internador()
+        self.sucessores = []
+        self.predecessores = []
+        self._vistas = VistasVizinhos()
+
+    def __contains__(self, vertice):
+        return vertice in self.vertices
+
+    def __len__(self):
+        return len(self.vertices)
+
+    def __iter__(self):
+        return iter(self.vertices)
+
+    def _internar(self, vertice):
+        """
+        Retorna o id de 'vertice', criando seus conjuntos vazios se ele for novo.
+        """
+        i = self.vertices.get(vertice)
+        if i is not None:
+            return i
+
+        i = self.vertices.internar(vertice)
+        if i == len(self.sucessores):
+            self.sucessores.append({})
+            self.predecessores.append({})
+        else:
+            self.sucessores[i] = {}
+            self.predecessores[i] = {}
+
+        return i
+
+    def _nomes(self, ids):
+        nome = self.vertices.nome
+        return [nome(j) for j in ids]
+
+    def inserir_vertice(self, vertice):
+        """
+        Insere um vértice no grafo, sem arestas iniciais.
+        """
+        if vertice in self.vertices:
+            return False
+
+        self._internar(vertice)
+        return True
+
+    def inserir_aresta(self, origem, destino, nao_direcionado=False, peso=1):
+        """
+        Adiciona aresta entre origem e destino, registrando também o predecessor.
+        O peso fica como valor em 'sucessores[i][j]' (reinserir atualiza o peso).
+        """
+        i = self._internar(origem)
+        j = self._internar(destino)
+
+        self.sucessores[i][j] = peso
+        self.predecessores[j][i] = None
+        self._vistas.alterar(origem)
+
+        if nao_direcionado:
+            self.sucessores[j][i] = peso
+            self.predecessores[i][j] = None
+            self._vistas.alterar(destino)
+
+    def inserir_arestas(self, arestas, nao_direcionado=False):
+        """
+        Adiciona várias arestas de uma vez (mesma regra de 'inserir_aresta',
+        sem chamadas de método por aresta para vértices já internados).
+        Cada aresta é (origem, destino) ou (origem, destino, peso).
+        """
+        ids, internar = self.vertices.ids, self._internar
+        sucessores, predecessores = self.sucessores, self.predecessores
+        alterar = self._vistas.alterar
+
+        for origem, destino, *peso in arestas:
+            peso = peso[0] if peso else 1
+            i = ids.get(origem)
+            if i is None:
+                i = internar(origem)
+            j = ids.get(destino)
+            if j is None:
+                j = internar(destino)
+
+            sucessores[i][j] = peso
+            predecessores[j][i] = None
+            alterar(origem)
+
+            if nao_direcionado:
+                sucessores[j][i] = peso
+                predecessores[i][j] = None
+                alterar(destino)
+
+    def vizinhos(self, vertice):
+        """
+        Retorna a tupla de vizinhos de 'vertice' (na ordem de inserção),
+        guardada até a próxima alteração dos vizinhos (ver vistas.py).
+        """
+        if vertice not in self.vertices:
+            return ()
+
+        return self._vistas.obter(vertice, self.iterar_vizinhos)
+
+    def iterar_vizinhos(self, vertice):
+        """
+        Gera os vizinhos de 'vertice' um a um, sem montar a lista.
+        """
+        i = self.vertices.get(vertice)
+        if i is None:
+            return
+
+        nome = self.vertices.nome
+        for j in self.sucessores[i]:
+            yield nome(j)
+
+    def iterar_predecessores(self, vertice):
+        """
+        Gera os vértices com aresta chegando em 'vertice', pelo índice reverso.
+        """
+        i = self.vertices.get(vertice)
+        if i is None:
+            return
+
+        nome = self.vertices.nome
+        for j in self.predecessores[i]:
+            yield nome(j)
+
+    def peso(self, origem, destino):
+        """
+        Retorna o peso da aresta origem -> destino, ou None se ela não existir.
+        """
+        i = self.vertices.get(origem)
+        j = self.vertices.get(destino)
+        if i is None or j is None:
+            return None
+
+        return self.sucessores[i].get(j)
+
+    def iterar_vizinhos_ponderados(self, vertice):
+        """
+        Retorna um iterador de pares (vizinho, peso) de 'vertice'.
+        O iterador é montado com zip/map sobre o dicionário, sem laço em Python.
+        """
+        i = self.vertices.get(vertice)
+        if i is None:
+            return iter(())
+
+        pesos = self.sucessores[i]
+        return zip(map(self.vertices.nomes.__getitem__, pesos), pesos.values())
+
+    def exibir_grafo(self):
+        """
+        Exibe o grafo em forma legível (lista de adjacência).
+        """
+        exibir_grafo({v: self._nomes(self.sucessores[i]) for v, i in self.vertices.ids.items()})
+
+    def remover_aresta(self, origem, destino, nao_direcionado=False):
+        """
+        Remove a aresta entre origem e destino (e a inversa, se não direcionado).
+        Retorna True se alguma aresta foi removida.
+        """
+        i = self.vertices.get(origem)
+        j = self.vertices.get(destino)
+        if i is None or j is None:
+            return False
+
+        removida = False
+
+        if j in self.sucessores[i]:
+            del self.sucessores[i][j]
+            del self.predecessores[j][i]
+            self._vistas.alterar(origem)
+            removida = True
+
+        if nao_direcionado and i in self.sucessores[j]:
+            del self.sucessores[j][i]
+            del self.predecessores[i][j]
+            self._vistas.alterar(destino)
+            removida = True
+
+        return removida
+
+    def remover_vertice(self, vertice):
+        """
+        Remove um vértice e todas as arestas que o tocam.
+
+        Passos:
+        1. Verificar se 'vertice' existe; se não, retornar False.
+        2. Invalidar as vistas de vizinhos dos predecessores (ver vistas.py).
+        3. Para cada predecessor p, remover o vértice de sucessores[p].
+        4. Para cada vizinho v, remover o vértice de predecessores[v].
+        5. Liberar o id do vértice (seus conjuntos viram None).
+        """
+        if vertice not in self.vertices:
+            return False
+
+        self._vistas.remover(vertice, self.iterar_predecessores(vertice))
+        i = self.vertices.liberar(vertice)
+
+        for anterior in self.predecessores[i]:
+            del self.sucessores[anterior][i]
+
+        for seguinte in self.sucessores[i]:
+            self.predecessores[seguinte].pop(i, None)
+
+        self.sucessores[i] = None
+        self.predecessores[i] = None
+        return True
+
+    def existe_aresta(self, origem, destino):
+        """
+        Verifica se existe aresta direta origem -> destino (O(1)).
+        """
+        i = self.vertices.get(origem)
+        j = self.vertices.get(destino)
+        return i is not None and j is not None and j in self.sucessores[i]
+
+    def grau_saida(self, vertice):
+        """
+        Retorna o grau de saída de 'vertice' em O(1) (0 se não existir).
+        """
+        i = self.vertices.get(vertice)
+        return 0 if i is None else len(self.sucessores[i])
+
+    def grau_entrada(self, vertice):
+        """
+        Retorna o grau de entrada de 'vertice' em O(1) (0 se não existir).
+        """
+        i = self.vertices.get(vertice)
+        return 0 if i is None else len(self.predecessores[i])
+
+    def grau_vertices(self, nao_direcionado=False):
+        """
+        Calcula o grau (out, in, total) de cada vértice, no formato de 'grau_vertices'.
+        Se nao_direcionado=True, retorna apenas o grau (tamanho da lista) de cada vértice.
+        """
+        if nao_direcionado:
+            return {v: len(self.sucessores[i]) for v, i in self.vertices.ids.items()}
+
+        graus = {}
+        for v, i in self.vertices.ids.items():
+            saida = len(self.sucessores[i])
+            entrada = len(self.predecessores[i])
+            graus[v] = {'in': entrada, 'out': saida, 'total': entrada + saida}
+
+        return graus
+
+    def percurso_valido(self, caminho):
+        """
+        Verifica se uma sequência de vértices (caminho) é válida.
+        """
+        for i in range(len(caminho) - 1):
+            if not self.existe_aresta(caminho[i], caminho[i + 1]):
+                return False
+
+        return True
+
+    def percursos_validos(self, caminhos):
+        """
+        Verifica muitos percursos de uma vez (ver 'percursos_validos').
+        """
+        sucessores = self.sucessores
+
+        def existentes(saltos):
+            return {(i, j) for i, j in saltos if j in sucessores[i]}
+
+        return validar_caminhos(caminhos, self.vertices, existentes)
+
+    def congelar(self):
+        """
+        Retorna um retrato imutável do grafo em formato CSR (vértices
+        renumerados de 0 a V-1 na ordem de inserção).
+        """
+        nomes, novo_id = self.vertices.compactar()
+        sucessores = self.sucessores
+        return construir_csr(nomes, ([novo_id[j] for j in sucessores[i]]
+                                     for i in self.vertices.ids.values()))
+
+
 def main():
     """
     Crie um menu onde seja possível escolher qual ação deseja realizar
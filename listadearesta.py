@@ -1,3 +1,14 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from heapq import merge
+
+from csr import construir_csr_de_pares
+from internador import Internador
+from percursos import validar_caminhos
+from vistas import VistasVizinhos
+
+
 def criar_grafo():
     """
     Cria e retorna uma estrutura de grafo com lista de arestas e lista de vértices.
@@ -49,6 +60,33 @@ def inserir_aresta(vertices, arestas, origem, destino, nao_direcionado=False):
             arestas.append(aresta_inversa)
 
 
+def inserir_arestas(vertices, arestas, novas_arestas, nao_direcionado=False):
+    """
+    Adiciona várias arestas (pares origem, destino) de uma só vez.
+
+    Passos:
+    1. Montar uma única vez um conjunto com os vértices e outro com as
+       arestas (tuplas) já existentes.
+    2. Para cada aresta nova (e a inversa, se nao_direcionado=True):
+          - inserir os vértices que ainda não estão no conjunto;
+          - adicionar [origem, destino] se a tupla ainda não estiver no conjunto.
+    """
+    vistos = set(vertices)
+    existentes = set(map(tuple, arestas))
+
+    for origem, destino in novas_arestas:
+        for vertice in (origem, destino):
+            if vertice not in vistos:
+                vistos.add(vertice)
+                vertices.append(vertice)
+
+        pares = ((origem, destino), (destino, origem)) if nao_direcionado else ((origem, destino),)
+        for par in pares:
+            if par not in existentes:
+                existentes.add(par)
+                arestas.append(list(par))
+
+
 def remover_aresta(arestas, origem, destino, nao_direcionado=False):
     """
     Remove uma aresta entre dois vértices.
@@ -176,6 +214,22 @@ def percurso_valido(arestas, caminho):
     return True
 
 
+def percursos_validos(arestas, caminhos):
+    """
+    Verifica muitos percursos de uma vez e retorna uma lista de bool.
+
+    Passos:
+    1. Juntar os saltos distintos de todos os caminhos ('validar_caminhos',
+       em percursos.py); os próprios nomes servem de chave.
+    2. Montar uma única vez o conjunto de tuplas das arestas e fazer a
+       interseção com os saltos, em vez de percorrer a lista a cada salto.
+    """
+    def existentes(saltos):
+        return saltos.intersection(map(tuple, arestas))
+
+    return validar_caminhos(caminhos, None, existentes)
+
+
 def listar_vizinhos(vertices, arestas, vertice):
     """
     Exibe os vizinhos de um vértice.
@@ -218,6 +272,745 @@ def exibir_grafo(vertices, arestas):
             print(f"  {o} -> {d}")
 
 
+def congelar(vertices, arestas):
+    """
+    Converte a lista de arestas em um GrafoCSR imutável (ver csr.py).
+
+    Passos:
+    1. Numerar os vértices na ordem de 'vertices'.
+    2. Traduzir origens e destinos para dois array('i') paralelos.
+    3. Montar o CSR agrupando as arestas por origem (ordenação por contagem).
+    """
+    indices = {v: i for i, v in enumerate(vertices)}
+    origens = array('i', [indices[o] for o, d in arestas])
+    destinos = array('i', [indices[d] for o, d in arestas])
+    return construir_csr_de_pares(list(vertices), origens, destinos)
+
+
+class ArestasIndexadas:
+    """
+    Lista de arestas com um índice de hash ao lado da lista ordenada.
+
+    Os vértices são internados em ids inteiros ('vertices', ver
+    internador.py): 'arestas' guarda tuplas de ids (origem, destino) e
+    '_posicoes' mapeia cada tupla para a sua posição na lista, de modo que
+    inserir, verificar e remover uma aresta custam O(1) esperado, em vez de
+    percorrer a lista inteira como 'aresta in arestas' /
+    'arestas.remove(aresta)'. Os nomes só aparecem na entrada e na saída
+    dos métodos.
+
+    A ordem de 'arestas' não é a de inserção (a remoção troca a aresta
+    removida com a última), mas 'exibir_grafo' continua mostrando tudo
+    ordenado.
+
+    Há ainda dois índices secundários por id: '_saida[i]' (destinos das
+    arestas que saem de i, com o peso de cada aresta como valor) e
+    '_entrada[i]' (origens das que chegam em i).
+    Com eles 'vizinhos' custa O(grau) e 'remover_vertice' só visita as
+    arestas incidentes ao vértice.
+    """
+
+    def __init__(self):
+        self.vertices = Internador()
+        self.arestas = []
+        self._posicoes = {}
+        self._saida = []
+        self._entrada = []
+        self._vistas = VistasVizinhos()
+
+    def __contains__(self, vertice):
+        return vertice in self.vertices
+
+    def __len__(self):
+        return len(self.vertices)
+
+    def __iter__(self):
+        return iter(self.vertices)
+
+    def _internar(self, vertice):
+        """
+        Retorna o id de 'vertice', criando seus índices vazios se ele for novo.
+        """
+        i = self.vertices.get(vertice)
+        if i is not None:
+            return i
+
+        i = self.vertices.internar(vertice)
+        if i == len(self._saida):
+            self._saida.append({})
+            self._entrada.append({})
+        else:
+            self._saida[i] = {}
+            self._entrada[i] = {}
+
+        return i
+
+    def inserir_vertice(self, vertice):
+        """
+        Adiciona um novo vértice no grafo (O(1)).
+        """
+        if vertice in self.vertices:
+            return False
+
+        self._internar(vertice)
+        return True
+
+    def _adicionar(self, aresta, peso=1):
+        """
+        Adiciona a tupla de ids no final da lista e registra sua posição (e
+        os índices de saída/entrada), se ainda não existir. O peso fica em
+        '_saida' e é atualizado mesmo se a aresta já existir.
+        """
+        origem, destino = aresta
+        self._saida[origem][destino] = peso
+        self._vistas.alterar(origem)
+
+        if aresta not in self._posicoes:
+            self._posicoes[aresta] = len(self.arestas)
+            self.arestas.append(aresta)
+            self._entrada[destino][origem] = None
+
+    def _retirar(self, aresta):
+        """
+        Retira a tupla de ids da lista em O(1).
+
+        Passos:
+        1. Obter a posição da aresta no dicionário; se não existir, retornar False.
+        2. Mover a última aresta da lista para essa posição (atualizando seu índice).
+        3. Descartar o final da lista.
+        4. Retirar a aresta dos índices de saída e entrada.
+        """
+        posicao = self._posicoes.pop(aresta, None)
+        if posicao is None:
+            return False
+
+        origem, destino = aresta
+        del self._saida[origem][destino]
+        del self._entrada[destino][origem]
+        self._vistas.alterar(origem)
+
+        ultima = self.arestas.pop()
+        if posicao < len(self.arestas):
+            self.arestas[posicao] = ultima
+            self._posicoes[ultima] = posicao
+
+        return True
+
+    def inserir_aresta(self, origem, destino, nao_direcionado=False, peso=1):
+        """
+        Adiciona a aresta (origem, destino) e, se não direcionado, também (destino, origem).
+        """
+        i = self._internar(origem)
+        j = self._internar(destino)
+
+        self._adicionar((i, j), peso)
+
+        if nao_direcionado:
+            self._adicionar((j, i), peso)
+
+    def inserir_arestas(self, arestas, nao_direcionado=False):
+        """
+        Adiciona várias arestas de uma vez (mesma regra de 'inserir_aresta').
+        Cada aresta é (origem, destino) ou (origem, destino, peso).
+        """
+        ids, internar = self.vertices.ids, self._internar
+        adicionar = self._adicionar
+
+        for origem, destino, *peso in arestas:
+            peso = peso[0] if peso else 1
+            i = ids.get(origem)
+            if i is None:
+                i = internar(origem)
+            j = ids.get(destino)
+            if j is None:
+                j = internar(destino)
+
+            adicionar((i, j), peso)
+            if nao_direcionado:
+                adicionar((j, i), peso)
+
+    def remover_aresta(self, origem, destino, nao_direcionado=False):
+        """
+        Remove a aresta (e a inversa, se não direcionado).
+        Retorna True se alguma aresta foi removida.
+        """
+        i = self.vertices.get(origem)
+        j = self.vertices.get(destino)
+        if i is None or j is None:
+            return False
+
+        removida = self._retirar((i, j))
+
+        if nao_direcionado:
+            removida = self._retirar((j, i)) or removida
+
+        return removida
+
+    def remover_vertice(self, vertice):
+        """
+        Remove um vértice e todas as arestas conectadas a ele.
+
+        Passos:
+        1. Verificar se o vértice existe.
+        2. Retirar as arestas de saída (índice '_saida') e de entrada
+           (índice '_entrada') do vértice; nenhuma outra aresta é visitada.
+        3. Liberar o id do vértice (seus índices viram None).
+        """
+        i = self.vertices.liberar(vertice)
+        if i is None:
+            return False
+
+        for destino in list(self._saida[i]):
+            self._retirar((i, destino))
+
+        for origem in list(self._entrada[i]):
+            self._retirar((origem, i))
+
+        self._saida[i] = None
+        self._entrada[i] = None
+        self._vistas.remover(i, ())
+        return True
+
+    def existe_aresta(self, origem, destino):
+        """
+        Verifica se existe a aresta origem -> destino (O(1) esperado).
+        """
+        i = self.vertices.get(origem)
+        j = self.vertices.get(destino)
+        return i is not None and j is not None and (i, j) in self._posicoes
+
+    def vizinhos(self, vertice):
+        """
+        Retorna a tupla de vizinhos (destinos das arestas que saem de 'vertice').
+        É montada em O(grau) só quando a saída do vértice mudou desde a
+        última chamada (ver vistas.py); as vistas são indexadas por id.
+        """
+        i = self.vertices.get(vertice)
+        if i is None:
+            return ()
+
+        return self._vistas.obter(i, self._nomes_saida)
+
+    def _nomes_saida(self, i):
+        """
+        Gera os nomes dos destinos das arestas que saem do id 'i'.
+        """
+        return map(self.vertices.nome, self._saida[i])
+
+    def iterar_vizinhos(self, vertice):
+        """
+        Gera os vizinhos de 'vertice' um a um, pelo índice de saída (O(grau)).
+        """
+        i = self.vertices.get(vertice)
+        if i is None:
+            return
+
+        nome = self.vertices.nome
+        for j in self._saida[i]:
+            yield nome(j)
+
+    def iterar_predecessores(self, vertice):
+        """
+        Gera os vértices com aresta chegando em 'vertice', pelo índice de entrada (O(grau)).
+        """
+        i = self.vertices.get(vertice)
+        if i is None:
+            return
+
+        nome = self.vertices.nome
+        for j in self._entrada[i]:
+            yield nome(j)
+
+    def peso(self, origem, destino):
+        """
+        Retorna o peso da aresta origem -> destino, ou None se ela não existir.
+        """
+        i = self.vertices.get(origem)
+        j = self.vertices.get(destino)
+        if i is None or j is None:
+            return None
+
+        return self._saida[i].get(j)
+
+    def iterar_vizinhos_ponderados(self, vertice):
+        """
+        Retorna um iterador de pares (vizinho, peso) de 'vertice', pelo índice de saída.
+        O iterador é montado com zip/map sobre o dicionário, sem laço em Python.
+        """
+        i = self.vertices.get(vertice)
+        if i is None:
+            return iter(())
+
+        pesos = self._saida[i]
+        return zip(map(self.vertices.nomes.__getitem__, pesos), pesos.values())
+
+    def grau_saida(self, vertice):
+        """
+        Retorna o grau de saída de 'vertice' em O(1) (0 se não existir).
+        """
+        i = self.vertices.get(vertice)
+        return 0 if i is None else len(self._saida[i])
+
+    def grau_entrada(self, vertice):
+        """
+        Retorna o grau de entrada de 'vertice' em O(1) (0 se não existir).
+        """
+        i = self.vertices.get(vertice)
+        return 0 if i is None else len(self._entrada[i])
+
+    def grau_vertices(self, nao_direcionado=False):
+        """
+        Calcula o grau de cada vértice (mesmo formato de 'grau_vertices'),
+        pelo tamanho dos índices de saída e entrada, em O(V).
+        """
+        if nao_direcionado:
+            return {v: len(self._saida[i]) for v, i in self.vertices.ids.items()}
+
+        graus = {}
+        for v, i in self.vertices.ids.items():
+            saida = len(self._saida[i])
+            entrada = len(self._entrada[i])
+            graus[v] = {'in': entrada, 'out': saida, 'total': entrada + saida}
+
+        return graus
+
+    def percurso_valido(self, caminho):
+        """
+        Verifica se um percurso é possível (seguindo as arestas na ordem dada).
+        """
+        for i in range(len(caminho) - 1):
+            if not self.existe_aresta(caminho[i], caminho[i + 1]):
+                return False
+
+        return True
+
+    def percursos_validos(self, caminhos):
+        """
+        Verifica muitos percursos de uma vez: os saltos distintos são
+        cruzados com o índice de arestas por uma única interseção de conjuntos.
+        """
+        def existentes(saltos):
+            return self._posicoes.keys() & saltos
+
+        return validar_caminhos(caminhos, self.vertices, existentes)
+
+    def exibir_grafo(self):
+        """
+        Exibe os vértices e todas as arestas, em ordem.
+        """
+        nome = self.vertices.nome
+        exibir_grafo(list(self.vertices), [(nome(o), nome(d)) for o, d in self.arestas])
+
+    def congelar(self):
+        """
+        Retorna um retrato imutável do grafo em formato CSR (vértices
+        renumerados de 0 a V-1 na ordem de inserção).
+        """
+        nomes, novo_id = self.vertices.compactar()
+        origens = array('i', [novo_id[o] for o, d in self.arestas])
+        destinos = array('i', [novo_id[d] for o, d in self.arestas])
+        return construir_csr_de_pares(nomes, origens, destinos)
+
+
+class ArestasInteiras:
+    """
+    Lista de arestas em duas colunas paralelas de inteiros.
+
+    'origens[k]' e 'destinos[k]' são os ids (ver internador.py) da k-ésima
+    aresta, guardados em array('i'): 8 bytes por aresta, em vez de uma lista
+    Python de dois elementos por aresta. 'pesos[k]' é o peso da k-ésima
+    aresta (1 se não informado), numa lista comum para manter o tipo do
+    peso como nas outras classes (int continua int).
+
+    As arestas ficam ordenadas por (origem, destino), o que permite:
+        vizinhos      - fatia contígua encontrada por busca binária em 'origens'
+        existe_aresta - busca binária em 'origens' e depois em 'destinos'
+        graus         - contagem em C (collections.Counter) sobre as colunas
+
+    Inserções são apenas anexadas ao final ('_ordenadas' marca até onde as
+    colunas estão ordenadas); a próxima consulta ordena o trecho novo,
+    descarta duplicatas e intercala com o trecho já ordenado. É uma
+    representação pensada para carga em lote seguida de muitas consultas:
+    alternar inserções e consultas a cada aresta custa O(E) por consulta.
+    Remoções também custam O(E) (deslocamento das colunas).
+    """
+
+    def __init__(self):
+        self.vertices = Internador()
+        self.origens = array('i')
+        self.destinos = array('i')
+        self.pesos = []
+        self._ordenadas = 0
+        self._reversa = None
+        self._vistas = VistasVizinhos()
+
+    def __contains__(self, vertice):
+        return vertice in self.vertices
+
+    def __len__(self):
+        return len(self.vertices)
+
+    def __iter__(self):
+        return iter(self.vertices)
+
+    def inserir_vertice(self, vertice):
+        """
+        Adiciona um novo vértice no grafo (O(1)).
+        """
+        if vertice in self.vertices:
+            return False
+
+        self.vertices.internar(vertice)
+        return True
+
+    def inserir_aresta(self, origem, destino, nao_direcionado=False, peso=1):
+        """
+        Anexa a aresta (e a inversa, se não direcionado) ao final das colunas.
+        Duplicatas são descartadas na próxima ordenação (fica o último peso).
+        """
+        self.inserir_arestas(((origem, destino, peso),), nao_direcionado)
+
+    def inserir_arestas(self, arestas, nao_direcionado=False):
+        """
+        Anexa várias arestas de uma vez ao final das colunas.
+        Cada aresta é (origem, destino) ou (origem, destino, peso).
+        """
+        internar, alterar = self.vertices.internar, self._vistas.alterar
+        origens, destinos, pesos = self.origens, self.destinos, self.pesos
+
+        for origem, destino, *peso in arestas:
+            peso = peso[0] if peso else 1
+            i = internar(origem)
+            j = internar(destino)
+            origens.append(i)
+            destinos.append(j)
+            pesos.append(peso)
+            alterar(i)
+            if nao_direcionado:
+                origens.append(j)
+                destinos.append(i)
+                pesos.append(peso)
+                alterar(j)
+
+    def _ordenar(self):
+        """
+        Deixa as colunas ordenadas por (origem, destino) e sem duplicatas.
+
+        Passos:
+        1. Se não houver arestas novas desde a última ordenação, não fazer nada.
+        2. Juntar as arestas novas (como chaves origem << 32 | destino) num
+           dicionário chave -> peso, o que descarta as repetidas (fica o
+           último peso); as que já existem no trecho ordenado só têm o peso
+           atualizado no lugar.
+        3. Ordenar as restantes e intercalá-las com o trecho ordenado,
+           reconstruindo as colunas.
+        """
+        n = self._ordenadas
+        if n == len(self.origens):
+            return
+
+        chaves_novas = [(o << 32) | d for o, d in zip(self.origens[n:], self.destinos[n:])]
+        novas = dict(zip(chaves_novas, self.pesos[n:]))
+
+        if n:
+            restantes = {}
+            for chave, peso in novas.items():
+                k = self._posicao(chave >> 32, chave & 0xFFFFFFFF)
+                if k is None:
+                    restantes[chave] = peso
+                else:
+                    self.pesos[k] = peso
+
+            antigas = zip(((o << 32) | d for o, d in zip(self.origens[:n], self.destinos[:n])), self.pesos[:n])
+            pares = list(merge(antigas, sorted(restantes.items())))
+            chaves = [chave for chave, _ in pares]
+            pesos = [peso for _, peso in pares]
+        else:
+            chaves = sorted(novas)
+            pesos = [novas[chave] for chave in chaves]
+
+        self.origens = array('i', [chave >> 32 for chave in chaves])
+        self.destinos = array('i', [chave & 0xFFFFFFFF for chave in chaves])
+        self.pesos = pesos
+        self._ordenadas = len(chaves)
+        self._reversa = None
+
+    def _indice_reverso(self):
+        """
+        Retorna (inicio, posicoes): as posições (em 'origens'/'destinos') das
+        arestas que chegam no id j estão em posicoes[inicio[j]:inicio[j+1]].
+
+        É uma ordenação por contagem da coluna 'destinos', feita uma vez e
+        guardada em '_reversa' até a próxima alteração das colunas ou até
+        surgir um id novo ('inicio' tem uma posição por id existente).
+        """
+        self._ordenar()
+        if self._reversa is not None and len(self._reversa[0]) == self.vertices.capacidade() + 1:
+            return self._reversa
+
+        n = self.vertices.capacidade()
+        inicio = array('q', bytes(8 * (n + 1)))
+        for d in self.destinos:
+            inicio[d + 1] += 1
+        for j in range(n):
+            inicio[j + 1] += inicio[j]
+
+        posicoes = array('i', bytes(4 * len(self.destinos)))
+        proxima = array('q', inicio)
+        for k, d in enumerate(self.destinos):
+            posicoes[proxima[d]] = k
+            proxima[d] += 1
+
+        self._reversa = (inicio, posicoes)
+        return self._reversa
+
+    def _faixa(self, i):
+        """
+        Retorna (a, b) tal que as arestas que saem de 'i' estão em [a, b) no trecho ordenado.
+        """
+        a = bisect_left(self.origens, i, 0, self._ordenadas)
+        b = bisect_right(self.origens, i, a, self._ordenadas)
+        return a, b
+
+    def _posicao(self, i, j):
+        """
+        Retorna a posição da aresta (i, j) no trecho ordenado, ou None.
+        """
+        a, b = self._faixa(i)
+        k = bisect_left(self.destinos, j, a, b)
+        return k if k < b and self.destinos[k] == j else None
+
+    def remover_aresta(self, origem, destino, nao_direcionado=False):
+        """
+        Remove a aresta (e a inversa, se não direcionado).
+        Retorna True se alguma aresta foi removida.
+        """
+        i = self.vertices.get(origem)
+        j = self.vertices.get(destino)
+        if i is None or j is None:
+            return False
+
+        self._ordenar()
+        removida = False
+
+        for a, b in ((i, j), (j, i)) if nao_direcionado else ((i, j),):
+            k = self._posicao(a, b)
+            if k is not None:
+                del self.origens[k]
+                del self.destinos[k]
+                del self.pesos[k]
+                self._ordenadas -= 1
+                self._reversa = None
+                self._vistas.alterar(a)
+                removida = True
+
+        return removida
+
+    def remover_vertice(self, vertice):
+        """
+        Remove um vértice e todas as arestas conectadas a ele.
+
+        Passos:
+        1. Verificar se o vértice existe e liberar seu id.
+        2. Reconstruir as colunas sem as arestas em que o id aparece (O(E)).
+        """
+        i = self.vertices.liberar(vertice)
+        if i is None:
+            return False
+
+        self._ordenar()
+        self._vistas.remover(i, [self.origens[k] for k in range(len(self.destinos))
+                                 if self.destinos[k] == i])
+        mantidas = [k for k in range(len(self.origens))
+                    if self.origens[k] != i and self.destinos[k] != i]
+        self.origens = array('i', [self.origens[k] for k in mantidas])
+        self.destinos = array('i', [self.destinos[k] for k in mantidas])
+        self.pesos = [self.pesos[k] for k in mantidas]
+        self._ordenadas = len(self.origens)
+        self._reversa = None
+        return True
+
+    def existe_aresta(self, origem, destino):
+        """
+        Verifica se existe a aresta origem -> destino (busca binária, O(log E)).
+        """
+        i = self.vertices.get(origem)
+        j = self.vertices.get(destino)
+        if i is None or j is None:
+            return False
+
+        self._ordenar()
+        return self._posicao(i, j) is not None
+
+    def vizinhos(self, vertice):
+        """
+        Retorna a tupla de vizinhos (fatia de 'destinos' da origem, em ordem
+        de id), montada só quando a saída do vértice mudou desde a última
+        chamada (ver vistas.py); as vistas são indexadas por id.
+        """
+        i = self.vertices.get(vertice)
+        if i is None:
+            return ()
+
+        return self._vistas.obter(i, self._nomes_saida)
+
+    def _nomes_saida(self, i):
+        """
+        Gera os nomes da fatia de 'destinos' do id 'i' (ordenando antes, se preciso).
+        """
+        self._ordenar()
+        a, b = self._faixa(i)
+        return map(self.vertices.nome, self.destinos[a:b])
+
+    def iterar_vizinhos(self, vertice):
+        """
+        Gera os vizinhos de 'vertice' um a um, percorrendo sua fatia de 'destinos'.
+        """
+        i = self.vertices.get(vertice)
+        if i is None:
+            return
+
+        self._ordenar()
+        a, b = self._faixa(i)
+        nome, destinos = self.vertices.nome, self.destinos
+        for k in range(a, b):
+            yield nome(destinos[k])
+
+    def iterar_predecessores(self, vertice):
+        """
+        Gera os vértices com aresta chegando em 'vertice', pelo índice reverso
+        (montado na primeira chamada após cada alteração, ver '_indice_reverso').
+
+        Um vértice inserido depois de o índice ser montado não o invalida:
+
+        >>> g = ArestasInteiras()
+        >>> g.inserir_aresta('a', 'b')
+        >>> list(g.iterar_predecessores('b'))
+        ['a']
+        >>> g.inserir_vertice('c')
+        True
+        >>> list(g.iterar_predecessores('c'))
+        []
+        """
+        i = self.vertices.get(vertice)
+        if i is None:
+            return
+
+        inicio, posicoes = self._indice_reverso()
+        nome, origens = self.vertices.nome, self.origens
+        for k in range(inicio[i], inicio[i + 1]):
+            yield nome(origens[posicoes[k]])
+
+    def peso(self, origem, destino):
+        """
+        Retorna o peso da aresta origem -> destino, ou None se ela não existir.
+        """
+        i = self.vertices.get(origem)
+        j = self.vertices.get(destino)
+        if i is None or j is None:
+            return None
+
+        self._ordenar()
+        k = self._posicao(i, j)
+        return None if k is None else self.pesos[k]
+
+    def iterar_vizinhos_ponderados(self, vertice):
+        """
+        Gera os pares (vizinho, peso) de 'vertice', percorrendo sua fatia.
+        """
+        i = self.vertices.get(vertice)
+        if i is None:
+            return
+
+        self._ordenar()
+        a, b = self._faixa(i)
+        nome, destinos, pesos = self.vertices.nome, self.destinos, self.pesos
+        for k in range(a, b):
+            yield nome(destinos[k]), pesos[k]
+
+    def grau_saida(self, vertice):
+        """
+        Retorna o grau de saída de 'vertice' (tamanho da sua fatia).
+        """
+        i = self.vertices.get(vertice)
+        if i is None:
+            return 0
+
+        self._ordenar()
+        a, b = self._faixa(i)
+        return b - a
+
+    def grau_entrada(self, vertice):
+        """
+        Retorna o grau de entrada de 'vertice' (tamanho da sua fatia no
+        índice reverso, montado uma vez por alteração; ver '_indice_reverso').
+        """
+        i = self.vertices.get(vertice)
+        if i is None:
+            return 0
+
+        inicio, _ = self._indice_reverso()
+        return inicio[i + 1] - inicio[i]
+
+    def grau_vertices(self, nao_direcionado=False):
+        """
+        Calcula o grau de cada vértice (mesmo formato de 'grau_vertices'),
+        contando as ocorrências de cada id nas duas colunas de uma vez.
+        """
+        self._ordenar()
+        saidas = Counter(self.origens)
+
+        if nao_direcionado:
+            return {v: saidas[i] for v, i in self.vertices.ids.items()}
+
+        entradas = Counter(self.destinos)
+        graus = {}
+        for v, i in self.vertices.ids.items():
+            graus[v] = {'in': entradas[i], 'out': saidas[i], 'total': entradas[i] + saidas[i]}
+
+        return graus
+
+    def percurso_valido(self, caminho):
+        """
+        Verifica se um percurso é possível (seguindo as arestas na ordem dada).
+        """
+        for i in range(len(caminho) - 1):
+            if not self.existe_aresta(caminho[i], caminho[i + 1]):
+                return False
+
+        return True
+
+    def percursos_validos(self, caminhos):
+        """
+        Verifica muitos percursos de uma vez: as colunas são ordenadas uma
+        única vez e cada salto distinto é procurado por busca binária.
+        """
+        def existentes(saltos):
+            self._ordenar()
+            return {(i, j) for i, j in saltos if self._posicao(i, j) is not None}
+
+        return validar_caminhos(caminhos, self.vertices, existentes)
+
+    def exibir_grafo(self):
+        """
+        Exibe os vértices e todas as arestas, em ordem.
+        """
+        self._ordenar()
+        nome = self.vertices.nome
+        exibir_grafo(list(self.vertices), [(nome(o), nome(d)) for o, d in zip(self.origens, self.destinos)])
+
+    def congelar(self):
+        """
+        Retorna um retrato imutável do grafo em formato CSR (vértices
+        renumerados de 0 a V-1 na ordem de inserção).
+        """
+        self._ordenar()
+        nomes, novo_id = self.vertices.compactar()
+        origens = array('i', [novo_id[o] for o in self.origens])
+        destinos = array('i', [novo_id[d] for d in self.destinos])
+        return construir_csr_de_pares(nomes, origens, destinos)
+
+
 def main():
     """
     Menu interativo para manipular o grafo (lista de arestas).
@@ -1,3 +1,10 @@
+from array import array
+
+from csr import construir_csr
+from percursos import validar_caminhos
+from vistas import VistasVizinhos
+
+
 def criar_grafo():
     """
     Cria e retorna uma matriz de adjacência vazia e uma lista de vértices.
@@ -62,6 +69,38 @@ def inserir_aresta(matriz, vertices, origem, destino, nao_direcionado=False):
         matriz[j][i] = 1
 
 
+def inserir_arestas(matriz, vertices, arestas, nao_direcionado=False):
+    """
+    Adiciona várias arestas (pares origem, destino) de uma só vez.
+
+    Passos:
+    1. Montar uma única vez o dicionário nome -> índice dos vértices atuais.
+    2. Percorrer as arestas numerando os vértices novos na ordem em que aparecem.
+    3. Aumentar a matriz uma única vez (colunas novas em cada linha e as linhas novas).
+    4. Marcar todas as conexões (e as inversas, se nao_direcionado=True).
+    """
+    indices = {v: i for i, v in enumerate(vertices)}
+    pares = []
+
+    for origem, destino in arestas:
+        for vertice in (origem, destino):
+            if vertice not in indices:
+                indices[vertice] = len(vertices)
+                vertices.append(vertice)
+        pares.append((indices[origem], indices[destino]))
+
+    n = len(vertices)
+    extra = [0] * (n - len(matriz))
+    for linha in matriz:
+        linha.extend(extra)
+    matriz.extend([0] * n for _ in range(n - len(matriz)))
+
+    for i, j in pares:
+        matriz[i][j] = 1
+        if nao_direcionado:
+            matriz[j][i] = 1
+
+
 def remover_vertice(matriz, vertices, vertice):
     """
     Remove um vértice e todas as arestas associadas.
@@ -176,32 +215,48 @@ def grau_vertices(matriz, vertices, nao_direcionado=False):
     3. Armazenar no dicionário no formato:
           graus[vértice] = {"saida": x, "entrada": y, "total": z} ou graus[vértice] = x.
     4. Retornar 'graus'.
+
+    As somas de linhas e de colunas são feitas por 'vetor_graus'.
     """
     graus = {}
-    n = len(vertices)
+    saidas, entradas = vetor_graus(matriz, vertices, apenas_saida=nao_direcionado)
 
-    for i in range(n):
-        nome_vertice = vertices[i]
-        
+    for i, nome_vertice in enumerate(vertices):
         if nao_direcionado:
-            grau = sum(matriz[i])
-            graus[nome_vertice] = grau
+            graus[nome_vertice] = saidas[i]
         else:
-            grau_saida = sum(matriz[i])
-            
-            grau_entrada = 0
-            for k in range(n):
-                grau_entrada += matriz[k][i]
-                
             graus[nome_vertice] = {
-                "saida": grau_saida,
-                "entrada": grau_entrada,
-                "total": grau_saida + grau_entrada
+                "saida": saidas[i],
+                "entrada": entradas[i],
+                "total": saidas[i] + entradas[i]
             }
             
     return graus
 
 
+def vetor_graus(matriz, vertices, apenas_saida=False):
+    """
+    Calcula os graus de saída e de entrada de todos os vértices de uma vez,
+    em forma compacta (dois array('i') na ordem de 'vertices').
+
+    Passos:
+    1. Grau de saída: somar cada linha com sum() (laço em C).
+    2. Grau de entrada: transpor a matriz com zip(*matriz) e somar cada
+       coluna da mesma forma, em vez de percorrer a matriz coluna a coluna
+       com um laço em Python.
+    3. Se apenas_saida=True, não calcular as entradas (retorna None no lugar).
+    4. Retornar (saidas, entradas).
+    """
+    n = len(vertices)
+    saidas = array('i', map(sum, matriz[:n]))
+
+    if apenas_saida:
+        return saidas, None
+
+    entradas = array('i', map(sum, zip(*matriz[:n])))
+    return saidas, entradas[:n]
+
+
 def percurso_valido(matriz, vertices, caminho):
     """
     Verifica se um percurso (sequência de vértices) é possível no grafo.
@@ -226,6 +281,24 @@ def percurso_valido(matriz, vertices, caminho):
     return True
 
 
+def percursos_validos(matriz, vertices, caminhos):
+    """
+    Verifica muitos percursos de uma vez e retorna uma lista de bool.
+
+    Passos:
+    1. Montar uma única vez o dicionário nome -> índice.
+    2. Deixar 'validar_caminhos' (percursos.py) traduzir cada nome uma vez e
+       juntar os saltos distintos de todos os caminhos.
+    3. Consultar na matriz cada salto distinto uma única vez.
+    """
+    indices = {v: i for i, v in enumerate(vertices)}
+
+    def existentes(saltos):
+        return {(i, j) for i, j in saltos if matriz[i][j] == 1}
+
+    return validar_caminhos(caminhos, indices, existentes)
+
+
 def listar_vizinhos(matriz, vertices, vertice):
     """
     Exibe (ou retorna) os vizinhos de um vértice.
@@ -276,6 +349,840 @@ def exibir_grafo(matriz, vertices):
         print()
 
 
+def congelar(matriz, vertices):
+    """
+    Converte a matriz em um GrafoCSR imutável (ver csr.py).
+
+    Passos:
+    1. Para cada linha i, listar os índices j com matriz[i][j] == 1.
+    2. Montar o CSR com 'vertices' como tabela de nomes.
+    """
+    n = len(vertices)
+    return construir_csr(vertices, ([j for j in range(n) if linha[j] == 1] for linha in matriz[:n]))
+
+
+class MatrizAdjacencia:
+    """
+    Matriz de adjacência com um dicionário nome -> índice.
+
+    Oferece as mesmas operações das funções deste módulo, mas localiza cada
+    vértice por 'indices[vertice]' (O(1)) em vez de 'vertice in vertices'
+    seguido de 'vertices.index(vertice)' (duas buscas O(V)).
+
+    O dicionário é mantido em sincronia por 'inserir_vertice' e
+    'remover_vertice'. Ao contrário das funções livres, os métodos não
+    imprimem mensagens: apenas retornam True/False.
+
+    A matriz tem uma capacidade reservada: 'len(self.matriz)' (e o tamanho
+    de cada linha) pode ser maior que o número de vértices, com as posições
+    excedentes zeradas. Quando a capacidade acaba ela é dobrada, de modo que
+    inserir V vértices um a um inicializa O(V²) células no total, em vez de
+    estender todas as linhas a cada inserção.
+
+    Os pesos ficam em um dicionário (origem, destino) -> peso só para as
+    arestas com peso diferente de 1 (como em 'MatrizBits'): um grafo sem
+    pesos não paga por uma segunda matriz.
+    """
+
+    def __init__(self, capacidade=0):
+        self.matriz, self.vertices = criar_grafo()
+        self.pesos = {}
+        self.indices = {}
+        self._vistas = VistasVizinhos()
+        self.reservar(capacidade)
+
+    def __contains__(self, vertice):
+        return vertice in self.indices
+
+    def __len__(self):
+        return len(self.vertices)
+
+    def __iter__(self):
+        return iter(self.vertices)
+
+    def reservar(self, n):
+        """
+        Garante capacidade para pelo menos 'n' vértices.
+
+        Passos:
+        1. Se a capacidade atual (len(self.matriz)) já for >= n, não fazer nada.
+        2. Caso contrário:
+              a) Estender cada linha existente com zeros até 'n' colunas.
+              b) Adicionar as novas linhas, já com 'n' zeros cada.
+        """
+        capacidade = len(self.matriz)
+        if n <= capacidade:
+            return
+
+        extra = [0] * (n - capacidade)
+        for linha in self.matriz:
+            linha.extend(extra)
+
+        self.matriz.extend([0] * n for _ in range(n - capacidade))
+
+    def inserir_vertice(self, vertice):
+        """
+        Adiciona um novo vértice ao grafo.
+
+        Passos:
+        1. Verificar no dicionário 'indices' se o vértice já existe.
+        2. Caso não exista:
+              - Se a capacidade estiver cheia, dobrá-la com 'reservar'.
+              - Registrar indices[vertice] = posição no final de 'vertices'.
+              (a linha e a coluna reservadas já estão zeradas)
+        """
+        if vertice in self.indices:
+            return False
+
+        n = len(self.vertices)
+        if n == len(self.matriz):
+            self.reservar(max(1, 2 * n))
+
+        self.indices[vertice] = n
+        self.vertices.append(vertice)
+        return True
+
+    def inserir_vertices(self, novos_vertices):
+        """
+        Insere vários vértices de uma vez, reservando a capacidade uma única vez.
+        Retorna quantos vértices foram realmente inseridos.
+        """
+        novos = [v for v in dict.fromkeys(novos_vertices) if v not in self.indices]
+        self.reservar(len(self.vertices) + len(novos))
+
+        for vertice in novos:
+            self.inserir_vertice(vertice)
+
+        return len(novos)
+
+    def inserir_arestas(self, arestas, nao_direcionado=False):
+        """
+        Adiciona várias arestas de uma vez: os vértices novos são inseridos
+        com uma única reserva de capacidade e depois as células são marcadas.
+        Cada aresta é (origem, destino) ou (origem, destino, peso).
+        """
+        pares = list(arestas)
+        self.inserir_vertices(v for par in pares for v in par[:2])
+
+        indices, matriz = self.indices, self.matriz
+        for origem, destino, *peso in pares:
+            i, j = indices[origem], indices[destino]
+            matriz[i][j] = 1
+            if peso or self.pesos:
+                self._definir_peso(origem, destino, peso[0] if peso else 1)
+            if nao_direcionado:
+                matriz[j][i] = 1
+                if peso or self.pesos:
+                    self._definir_peso(destino, origem, peso[0] if peso else 1)
+
+        self._vistas.alterar_varios(par[0] for par in pares)
+        if nao_direcionado:
+            self._vistas.alterar_varios(par[1] for par in pares)
+
+    def _definir_peso(self, origem, destino, peso):
+        """
+        Guarda o peso de origem -> destino em 'pesos' (apenas se diferente de 1).
+        """
+        if peso == 1:
+            self.pesos.pop((origem, destino), None)
+        else:
+            self.pesos[(origem, destino)] = peso
+
+    def inserir_aresta(self, origem, destino, nao_direcionado=False, peso=1):
+        """
+        Adiciona uma aresta entre dois vértices (inserindo-os se necessário).
+        """
+        self.inserir_vertice(origem)
+        self.inserir_vertice(destino)
+
+        i = self.indices[origem]
+        j = self.indices[destino]
+
+        self.matriz[i][j] = 1
+        self._definir_peso(origem, destino, peso)
+        self._vistas.alterar(origem)
+
+        if nao_direcionado:
+            self.matriz[j][i] = 1
+            self._definir_peso(destino, origem, peso)
+            self._vistas.alterar(destino)
+
+    def remover_vertice(self, vertice, trocar_com_ultimo=False):
+        """
+        Remove um vértice e todas as arestas associadas.
+
+        Passos (padrão, preserva a ordem de inserção):
+        1. Obter o índice pelo dicionário; se não existir, retornar False.
+        2. Remover a linha e a coluna desse índice e o nome em 'vertices'
+           (a capacidade reservada diminui em uma posição).
+        3. Atualizar 'indices' dos vértices que estavam depois dele
+           (cada um desce uma posição).
+
+        Com trocar_com_ultimo=True o último vértice é movido para a posição
+        do removido (ver '_remover_trocando'): custa O(V) em vez de O(V²),
+        mas 'vertices' deixa de estar em ordem de inserção.
+        """
+        idx = self.indices.get(vertice)
+        if idx is None:
+            return False
+
+        if self.pesos:
+            for destino in self.iterar_vizinhos(vertice):
+                self.pesos.pop((vertice, destino), None)
+            for origem in self.iterar_predecessores(vertice):
+                self.pesos.pop((origem, vertice), None)
+
+        self._vistas.remover(vertice, self.iterar_predecessores(vertice))
+        del self.indices[vertice]
+
+        if trocar_com_ultimo:
+            # O último vértice muda de coluna: muda a ordem dos vizinhos de quem aponta para ele.
+            self._vistas.alterar_varios(self.iterar_predecessores(self.vertices[-1]))
+            self._remover_trocando(idx)
+            return True
+
+        self.matriz.pop(idx)
+
+        for linha in self.matriz:
+            linha.pop(idx)
+
+        self.vertices.pop(idx)
+
+        for k in range(idx, len(self.vertices)):
+            self.indices[self.vertices[k]] = k
+
+        return True
+
+    def _remover_trocando(self, idx):
+        """
+        Remove o vértice da posição 'idx' trocando-o com o último.
+
+        Passos:
+        1. Trocar as linhas 'idx' e 'ultimo' de lugar.
+        2. Em cada linha, copiar a coluna 'ultimo' para a coluna 'idx' e zerar 'ultimo'.
+        3. Zerar a linha 'ultimo' (agora com as arestas do removido).
+        4. Mover o nome do último vértice para 'idx' e atualizar seu índice.
+
+        Apenas uma linha e uma coluna são tocadas (O(V)); nenhuma linha é
+        encolhida e a capacidade reservada se mantém. Os demais vértices
+        mantêm seus índices.
+        """
+        ultimo = len(self.vertices) - 1
+        matriz = self.matriz
+
+        matriz[idx], matriz[ultimo] = matriz[ultimo], matriz[idx]
+
+        for r in range(ultimo + 1):
+            linha = matriz[r]
+            linha[idx] = linha[ultimo]
+            linha[ultimo] = 0
+
+        matriz[ultimo][:ultimo + 1] = [0] * (ultimo + 1)
+
+        movido = self.vertices.pop()
+        if idx != ultimo:
+            self.vertices[idx] = movido
+            self.indices[movido] = idx
+
+    def remover_aresta(self, origem, destino, nao_direcionado=False):
+        """
+        Remove a aresta origem -> destino (e a inversa, se não direcionado).
+        Retorna True se alguma aresta foi removida (como nas listas).
+        """
+        i = self.indices.get(origem)
+        j = self.indices.get(destino)
+        if i is None or j is None:
+            return False
+
+        removida = False
+
+        if self.matriz[i][j] == 1:
+            self.matriz[i][j] = 0
+            self.pesos.pop((origem, destino), None)
+            self._vistas.alterar(origem)
+            removida = True
+
+        if nao_direcionado and self.matriz[j][i] == 1:
+            self.matriz[j][i] = 0
+            self.pesos.pop((destino, origem), None)
+            self._vistas.alterar(destino)
+            removida = True
+
+        return removida
+
+    def existe_aresta(self, origem, destino):
+        """
+        Verifica se existe uma aresta direta origem -> destino.
+        """
+        i = self.indices.get(origem)
+        j = self.indices.get(destino)
+        if i is None or j is None:
+            return False
+
+        return self.matriz[i][j] == 1
+
+    def vizinhos(self, vertice):
+        """
+        Retorna a tupla de vizinhos (vértices alcançáveis a partir de 'vertice').
+        A varredura da linha só é refeita se os vizinhos mudaram desde a
+        última chamada (ver vistas.py); caso contrário custa O(1).
+        """
+        if vertice not in self.indices:
+            return ()
+
+        return self._vistas.obter(vertice, self.iterar_vizinhos)
+
+    def iterar_vizinhos(self, vertice):
+        """
+        Gera os vizinhos de 'vertice' um a um, sem montar a lista.
+        """
+        i = self.indices.get(vertice)
+        if i is None:
+            return
+
+        vertices = self.vertices
+        linha = self.matriz[i]
+        for j in range(len(vertices)):
+            if linha[j] == 1:
+                yield vertices[j]
+
+    def iterar_predecessores(self, vertice):
+        """
+        Gera os vértices com aresta chegando em 'vertice' (varredura da coluna).
+        """
+        j = self.indices.get(vertice)
+        if j is None:
+            return
+
+        vertices, matriz = self.vertices, self.matriz
+        for i in range(len(vertices)):
+            if matriz[i][j] == 1:
+                yield vertices[i]
+
+    def peso(self, origem, destino):
+        """
+        Retorna o peso da aresta origem -> destino, ou None se ela não existir.
+        """
+        i = self.indices.get(origem)
+        j = self.indices.get(destino)
+        if i is None or j is None or self.matriz[i][j] != 1:
+            return None
+
+        return self.pesos.get((origem, destino), 1)
+
+    def iterar_vizinhos_ponderados(self, vertice):
+        """
+        Gera os pares (vizinho, peso) de 'vertice' (varredura da linha).
+        """
+        i = self.indices.get(vertice)
+        if i is None:
+            return
+
+        vertices, linha, pesos = self.vertices, self.matriz[i], self.pesos
+        for j in range(len(vertices)):
+            if linha[j] == 1:
+                destino = vertices[j]
+                yield destino, pesos.get((vertice, destino), 1) if pesos else 1
+
+    def grau_saida(self, vertice):
+        """
+        Retorna o grau de saída de 'vertice' (soma da sua linha).
+        """
+        i = self.indices.get(vertice)
+        return 0 if i is None else sum(self.matriz[i])
+
+    def grau_entrada(self, vertice):
+        """
+        Retorna o grau de entrada de 'vertice' (soma da sua coluna).
+        """
+        i = self.indices.get(vertice)
+        if i is None:
+            return 0
+
+        return sum(linha[i] for linha in self.matriz)
+
+    def grau_vertices(self, nao_direcionado=False):
+        """
+        Calcula o grau de cada vértice no formato comum do protocolo 'Grafo'
+        (chaves 'in', 'out' e 'total', como nas listas); a função
+        'grau_vertices' do módulo mantém as chaves "saida"/"entrada".
+        Se nao_direcionado=True, retorna apenas o grau de saída de cada vértice.
+        """
+        saidas, entradas = self.vetor_graus(apenas_saida=nao_direcionado)
+
+        if nao_direcionado:
+            return {v: saidas[i] for i, v in enumerate(self.vertices)}
+
+        graus = {}
+        for i, v in enumerate(self.vertices):
+            graus[v] = {'in': entradas[i], 'out': saidas[i], 'total': entradas[i] + saidas[i]}
+
+        return graus
+
+    def vetor_graus(self, apenas_saida=False):
+        """
+        Retorna (saidas, entradas) como array('i'), como 'vetor_graus'.
+        """
+        return vetor_graus(self.matriz, self.vertices, apenas_saida)
+
+    def percurso_valido(self, caminho):
+        """
+        Verifica se um percurso (sequência de vértices) é possível no grafo.
+        """
+        for i in range(len(caminho) - 1):
+            if not self.existe_aresta(caminho[i], caminho[i + 1]):
+                return False
+
+        return True
+
+    def percursos_validos(self, caminhos):
+        """
+        Verifica muitos percursos de uma vez (ver 'percursos_validos').
+        """
+        matriz = self.matriz
+
+        def existentes(saltos):
+            return {(i, j) for i, j in saltos if matriz[i][j] == 1}
+
+        return validar_caminhos(caminhos, self.indices, existentes)
+
+    def exibir_grafo(self):
+        """
+        Exibe o grafo em formato de matriz de adjacência.
+        """
+        exibir_grafo(self.matriz, self.vertices)
+
+    def congelar(self):
+        """
+        Retorna um retrato imutável do grafo em formato CSR.
+        """
+        return congelar(self.matriz, self.vertices)
+
+
+def _posicoes_bits(bits):
+    """
+    Gera as posições dos bits ligados de um inteiro, da menor para a maior.
+
+    Passos:
+    1. Converter o inteiro para binário invertido (bit 0 primeiro).
+    2. Procurar cada '1' com str.find (varredura feita em C).
+    """
+    texto = bin(bits)[:1:-1]
+    j = texto.find('1')
+    while j != -1:
+        yield j
+        j = texto.find('1', j + 1)
+
+
+class MatrizBits:
+    """
+    Matriz de adjacência compacta, com cada linha guardada como um inteiro
+    usado como conjunto de bits (bit j da linha i ligado <=> aresta i -> j).
+
+    Uma lista de listas de int gasta um ponteiro de 8 bytes por célula; aqui
+    cada célula ocupa 1 bit na linha e 1 bit na coluna, ou seja, cerca de
+    32x menos memória. As colunas são guardadas como inteiros para que graus
+    de entrada e de saída sejam calculados com int.bit_count() sobre a
+    linha/coluna inteira, sem laços em Python célula a célula.
+
+    Os pesos ficam em um dicionário (origem, destino) -> peso só para as
+    arestas com peso diferente de 1, para não perder a compactação da
+    matriz de bits em grafos sem peso.
+
+    Oferece as mesmas operações de 'MatrizAdjacencia'.
+    """
+
+    def __init__(self):
+        self.vertices = []
+        self.indices = {}
+        self.linhas = []
+        self.colunas = []
+        self.pesos = {}
+        self._vistas = VistasVizinhos()
+
+    def __contains__(self, vertice):
+        return vertice in self.indices
+
+    def __len__(self):
+        return len(self.vertices)
+
+    def __iter__(self):
+        return iter(self.vertices)
+
+    def inserir_vertice(self, vertice):
+        """
+        Adiciona um novo vértice (linha e coluna vazias, ou seja, 0).
+        """
+        if vertice in self.indices:
+            return False
+
+        self.indices[vertice] = len(self.vertices)
+        self.vertices.append(vertice)
+        self.linhas.append(0)
+        self.colunas.append(0)
+        return True
+
+    def _definir_peso(self, origem, destino, peso):
+        """
+        Guarda o peso de origem -> destino em 'pesos' (apenas se diferente de 1).
+        """
+        if peso == 1:
+            self.pesos.pop((origem, destino), None)
+        else:
+            self.pesos[(origem, destino)] = peso
+
+    def inserir_aresta(self, origem, destino, nao_direcionado=False, peso=1):
+        """
+        Adiciona uma aresta ligando o bit 'j' da linha 'i' e o bit 'i' da coluna 'j'.
+        """
+        self.inserir_vertice(origem)
+        self.inserir_vertice(destino)
+
+        i = self.indices[origem]
+        j = self.indices[destino]
+
+        self.linhas[i] |= 1 << j
+        self.colunas[j] |= 1 << i
+        self._definir_peso(origem, destino, peso)
+        self._vistas.alterar(origem)
+
+        if nao_direcionado:
+            self.linhas[j] |= 1 << i
+            self.colunas[i] |= 1 << j
+            self._definir_peso(destino, origem, peso)
+            self._vistas.alterar(destino)
+
+    def inserir_arestas(self, arestas, nao_direcionado=False):
+        """
+        Adiciona várias arestas de uma vez.
+        Cada aresta é (origem, destino) ou (origem, destino, peso).
+
+        Passos:
+        1. Inserir os vértices novos (e guardar os pesos diferentes de 1).
+        2. Marcar os bits de cada linha/coluna tocada em um bytearray (O(1)
+           por aresta), em vez de recriar o inteiro da linha a cada aresta.
+        3. Converter cada bytearray com int.from_bytes e juntar (OR) à linha
+           ou coluna correspondente.
+        """
+        pares = []
+        for origem, destino, *peso in arestas:
+            self.inserir_vertice(origem)
+            self.inserir_vertice(destino)
+            i, j = self.indices[origem], self.indices[destino]
+            pares.append((i, j))
+            if peso or self.pesos:
+                self._definir_peso(origem, destino, peso[0] if peso else 1)
+            if nao_direcionado:
+                pares.append((j, i))
+                if peso or self.pesos:
+                    self._definir_peso(destino, origem, peso[0] if peso else 1)
+
+        tamanho = (len(self.vertices) + 7) // 8
+        novas_linhas = {}
+        novas_colunas = {}
+
+        for i, j in pares:
+            for tabela, k, bit in ((novas_linhas, i, j), (novas_colunas, j, i)):
+                bits = tabela.get(k)
+                if bits is None:
+                    bits = tabela[k] = bytearray(tamanho)
+                bits[bit >> 3] |= 1 << (bit & 7)
+
+        for destino, tabela in ((self.linhas, novas_linhas), (self.colunas, novas_colunas)):
+            for k, bits in tabela.items():
+                destino[k] |= int.from_bytes(bits, 'little')
+
+        vertices = self.vertices
+        self._vistas.alterar_varios(vertices[k] for k in novas_linhas)
+
+    def remover_vertice(self, vertice, trocar_com_ultimo=False):
+        """
+        Remove um vértice e todas as arestas associadas.
+
+        Passos (padrão, preserva a ordem de inserção):
+        1. Obter o índice 'idx'; se não existir, retornar False.
+        2. Remover a linha e a coluna 'idx'.
+        3. Em cada linha e coluna restante, retirar o bit 'idx' juntando os
+           bits abaixo dele com os bits acima deslocados uma posição.
+        4. Atualizar 'indices' dos vértices que estavam depois dele.
+
+        Com trocar_com_ultimo=True o último vértice assume a posição 'idx' e
+        só as linhas/colunas vizinhas dos dois vértices são alteradas (mesma
+        semântica de ordem de 'MatrizAdjacencia.remover_vertice').
+        """
+        idx = self.indices.get(vertice)
+        if idx is None:
+            return False
+
+        self._vistas.remover(vertice, self.iterar_predecessores(vertice))
+        del self.indices[vertice]
+
+        if self.pesos:
+            vertices = self.vertices
+            for j in _posicoes_bits(self.linhas[idx]):
+                self.pesos.pop((vertice, vertices[j]), None)
+            for j in _posicoes_bits(self.colunas[idx]):
+                self.pesos.pop((vertices[j], vertice), None)
+
+        if trocar_com_ultimo:
+            # O último vértice muda de coluna: muda a ordem dos vizinhos de quem aponta para ele.
+            self._vistas.alterar_varios(self.iterar_predecessores(self.vertices[-1]))
+            self._remover_trocando(idx)
+            return True
+
+        self.linhas.pop(idx)
+        self.colunas.pop(idx)
+        self.vertices.pop(idx)
+
+        mascara = (1 << idx) - 1
+        for bits in (self.linhas, self.colunas):
+            for k, valor in enumerate(bits):
+                bits[k] = (valor & mascara) | ((valor >> (idx + 1)) << idx)
+
+        for k in range(idx, len(self.vertices)):
+            self.indices[self.vertices[k]] = k
+
+        return True
+
+    def _remover_trocando(self, idx):
+        """
+        Remove o vértice da posição 'idx' trocando-o com o último.
+
+        Passos:
+        1. Guardar linha e coluna do removido e do último (antes de alterar).
+        2. Nas linhas que apontam para o removido, desligar o bit 'idx';
+           nas que apontam para o último, mover o bit 'ultimo' para 'idx'.
+        3. Repetir o passo 2 nas colunas, usando as linhas guardadas.
+        4. Mover linha, coluna e nome do último para 'idx' e descartar o final.
+        """
+        ultimo = len(self.vertices) - 1
+        linhas, colunas = self.linhas, self.colunas
+        bit_idx = 1 << idx
+
+        if idx == ultimo:
+            for r in _posicoes_bits(colunas[idx]):
+                linhas[r] &= ~bit_idx
+            for c in _posicoes_bits(linhas[idx]):
+                colunas[c] &= ~bit_idx
+        else:
+            bit_ultimo = 1 << ultimo
+            linha_removido, linha_ultimo = linhas[idx], linhas[ultimo]
+            coluna_removido, coluna_ultimo = colunas[idx], colunas[ultimo]
+
+            for bits, removido, movido in ((linhas, coluna_removido, coluna_ultimo),
+                                           (colunas, linha_removido, linha_ultimo)):
+                for k in _posicoes_bits(removido):
+                    bits[k] &= ~bit_idx
+                for k in _posicoes_bits(movido):
+                    bits[k] = (bits[k] & ~bit_ultimo) | bit_idx
+
+            linhas[idx] = linhas[ultimo]
+            colunas[idx] = colunas[ultimo]
+
+        linhas.pop()
+        colunas.pop()
+
+        movido = self.vertices.pop()
+        if idx != ultimo:
+            self.vertices[idx] = movido
+            self.indices[movido] = idx
+
+    def remover_aresta(self, origem, destino, nao_direcionado=False):
+        """
+        Remove a aresta origem -> destino (e a inversa, se não direcionado).
+        Retorna True se alguma aresta foi removida (bit ligado antes de apagar).
+        """
+        i = self.indices.get(origem)
+        j = self.indices.get(destino)
+        if i is None or j is None:
+            return False
+
+        removida = False
+
+        if (self.linhas[i] >> j) & 1:
+            self.linhas[i] &= ~(1 << j)
+            self.colunas[j] &= ~(1 << i)
+            self.pesos.pop((origem, destino), None)
+            self._vistas.alterar(origem)
+            removida = True
+
+        if nao_direcionado and (self.linhas[j] >> i) & 1:
+            self.linhas[j] &= ~(1 << i)
+            self.colunas[i] &= ~(1 << j)
+            self.pesos.pop((destino, origem), None)
+            self._vistas.alterar(destino)
+            removida = True
+
+        return removida
+
+    def existe_aresta(self, origem, destino):
+        """
+        Verifica se o bit 'j' da linha 'i' está ligado.
+        """
+        i = self.indices.get(origem)
+        j = self.indices.get(destino)
+        if i is None or j is None:
+            return False
+
+        return (self.linhas[i] >> j) & 1 == 1
+
+    def vizinhos(self, vertice):
+        """
+        Retorna a tupla de vizinhos, lendo os bits ligados da linha do vértice
+        apenas se ela mudou desde a última chamada (ver vistas.py).
+        """
+        if vertice not in self.indices:
+            return ()
+
+        return self._vistas.obter(vertice, self.iterar_vizinhos)
+
+    def iterar_vizinhos(self, vertice):
+        """
+        Gera os vizinhos de 'vertice' um a um, lendo os bits ligados da linha.
+        """
+        i = self.indices.get(vertice)
+        if i is None:
+            return
+
+        vertices = self.vertices
+        for j in _posicoes_bits(self.linhas[i]):
+            yield vertices[j]
+
+    def iterar_predecessores(self, vertice):
+        """
+        Gera os vértices com aresta chegando em 'vertice', lendo os bits da coluna.
+        """
+        j = self.indices.get(vertice)
+        if j is None:
+            return
+
+        vertices = self.vertices
+        for i in _posicoes_bits(self.colunas[j]):
+            yield vertices[i]
+
+    def peso(self, origem, destino):
+        """
+        Retorna o peso da aresta origem -> destino, ou None se ela não existir.
+        """
+        if not self.existe_aresta(origem, destino):
+            return None
+
+        return self.pesos.get((origem, destino), 1)
+
+    def iterar_vizinhos_ponderados(self, vertice):
+        """
+        Gera os pares (vizinho, peso) de 'vertice', lendo os bits da linha.
+        """
+        i = self.indices.get(vertice)
+        if i is None:
+            return
+
+        vertices, pesos = self.vertices, self.pesos
+        for j in _posicoes_bits(self.linhas[i]):
+            destino = vertices[j]
+            yield destino, pesos.get((vertice, destino), 1) if pesos else 1
+
+    def grau_saida(self, vertice):
+        """
+        Retorna o grau de saída de 'vertice' (bits ligados da linha).
+        """
+        i = self.indices.get(vertice)
+        return 0 if i is None else self.linhas[i].bit_count()
+
+    def grau_entrada(self, vertice):
+        """
+        Retorna o grau de entrada de 'vertice' (bits ligados da coluna).
+        """
+        i = self.indices.get(vertice)
+        return 0 if i is None else self.colunas[i].bit_count()
+
+    def grau_vertices(self, nao_direcionado=False):
+        """
+        Calcula o grau de cada vértice (mesmo formato de
+        'MatrizAdjacencia.grau_vertices': chaves 'in', 'out' e 'total'),
+        contando os bits de cada linha (saída) e de cada coluna (entrada).
+        """
+        graus = {}
+
+        for i, nome_vertice in enumerate(self.vertices):
+            grau_saida = self.linhas[i].bit_count()
+
+            if nao_direcionado:
+                graus[nome_vertice] = grau_saida
+            else:
+                grau_entrada = self.colunas[i].bit_count()
+                graus[nome_vertice] = {
+                    'in': grau_entrada,
+                    'out': grau_saida,
+                    'total': grau_saida + grau_entrada
+                }
+
+        return graus
+
+    def vetor_graus(self, apenas_saida=False):
+        """
+        Retorna (saidas, entradas) como array('i'), contando os bits de cada
+        linha e de cada coluna.
+        """
+        saidas = array('i', [linha.bit_count() for linha in self.linhas])
+
+        if apenas_saida:
+            return saidas, None
+
+        return saidas, array('i', [coluna.bit_count() for coluna in self.colunas])
+
+    def percurso_valido(self, caminho):
+        """
+        Verifica se um percurso (sequência de vértices) é possível no grafo.
+        """
+        for i in range(len(caminho) - 1):
+            if not self.existe_aresta(caminho[i], caminho[i + 1]):
+                return False
+
+        return True
+
+    def percursos_validos(self, caminhos):
+        """
+        Verifica muitos percursos de uma vez, retornando uma lista de bool.
+
+        Os saltos distintos são agrupados por origem; para cada origem, os
+        destinos pedidos viram uma máscara de bits que é comparada com a
+        linha inteira com um único AND.
+        """
+        def existentes(saltos):
+            por_origem = {}
+            for i, j in saltos:
+                por_origem.setdefault(i, []).append(j)
+
+            tamanho = (len(self.vertices) + 7) // 8
+            resultado = set()
+
+            for i, destinos in por_origem.items():
+                mascara = bytearray(tamanho)
+                for j in destinos:
+                    mascara[j >> 3] |= 1 << (j & 7)
+                presentes = int.from_bytes(mascara, 'little') & self.linhas[i]
+                resultado.update((i, j) for j in _posicoes_bits(presentes))
+
+            return resultado
+
+        return validar_caminhos(caminhos, self.indices, existentes)
+
+    def exibir_grafo(self):
+        """
+        Exibe o grafo em formato de matriz de adjacência (0 ou 1 por célula).
+        """
+        n = len(self.vertices)
+        matriz = [[(linha >> j) & 1 for j in range(n)] for linha in self.linhas]
+        exibir_grafo(matriz, self.vertices)
+
+    def congelar(self):
+        """
+        Retorna um retrato imutável do grafo em formato CSR (bits ligados de cada linha).
+        """
+        return construir_csr(self.vertices, (_posicoes_bits(linha) for linha in self.linhas))
+
+
 def main():
     """
     Menu interativo para manipular o grafo (matriz de adjacência).
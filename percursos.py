@@ -0,0 +1,53 @@
+def separar_caminhos(vertices, inicios):
+    """
+    Gera os caminhos de uma representação plana: todos os vértices de todos
+    os caminhos em 'vertices' e, em 'inicios' (len = número de caminhos + 1),
+    onde cada caminho começa; o caminho k é vertices[inicios[k]:inicios[k+1]].
+    """
+    for k in range(len(inicios) - 1):
+        yield vertices[inicios[k]:inicios[k + 1]]
+
+
+def validar_caminhos(caminhos, indices, arestas_existentes):
+    """
+    Valida muitos percursos de uma vez e retorna uma lista de bool (um por caminho).
+
+    'indices' traduz nome -> id (qualquer objeto com .get; None se os nomes
+    já forem os ids) e 'arestas_existentes' recebe um conjunto de pares de
+    ids e devolve o subconjunto dos que são arestas do grafo.
+
+    Passos:
+    1. Traduzir cada nome distinto uma única vez; um caminho com algum
+       vértice inexistente (e pelo menos 2 vértices) é inválido.
+    2. Juntar em um conjunto os saltos (u, v) distintos de todos os caminhos.
+    3. Consultar o grafo uma única vez com todos os saltos.
+    4. Um caminho é válido se todos os seus saltos estiverem entre os existentes
+       (caminhos com menos de 2 vértices são sempre válidos, como em 'percurso_valido').
+    """
+    traducao = {}
+    caminhos_ids = []
+    saltos = set()
+
+    for caminho in caminhos:
+        if len(caminho) < 2:
+            caminhos_ids.append(())
+            continue
+
+        ids = []
+        for nome in caminho:
+            if nome not in traducao:
+                traducao[nome] = nome if indices is None else indices.get(nome)
+            i = traducao[nome]
+            if i is None:
+                ids = None
+                break
+            ids.append(i)
+
+        caminhos_ids.append(ids)
+        if ids is not None:
+            saltos.update(zip(ids, ids[1:]))
+
+    existentes = arestas_existentes(saltos)
+
+    return [ids is not None and all(salto in existentes for salto in zip(ids, ids[1:]))
+            for ids in caminhos_ids]
@@ -0,0 +1,109 @@
+from matriz import MatrizBits, _posicoes_bits
+
+
+def linhas_de_bits(grafo):
+    """
+    Retorna (vertices, linhas): a lista de vértices e, para cada posição i,
+    um inteiro com o bit j ligado se existe a aresta vertices[i] -> vertices[j].
+
+    Uma 'MatrizBits' já guarda as linhas nesse formato e elas são usadas
+    diretamente (sem cópia). Para as outras representações, cada linha é
+    marcada em um bytearray (O(1) por aresta) e convertida uma única vez com
+    int.from_bytes, como em 'MatrizBits.inserir_arestas': O(V²/8 + E) no
+    total, em vez de recriar o inteiro da linha a cada aresta.
+    """
+    if isinstance(grafo, MatrizBits):
+        return grafo.vertices, grafo.linhas
+
+    vertices = list(grafo)
+    indices = {v: i for i, v in enumerate(vertices)}
+    tamanho = (len(vertices) + 7) // 8
+    linhas = []
+    for v in vertices:
+        bits = bytearray(tamanho)
+        for w in grafo.iterar_vizinhos(v):
+            j = indices[w]
+            bits[j >> 3] |= 1 << (j & 7)
+        linhas.append(int.from_bytes(bits, 'little'))
+
+    return vertices, linhas
+
+
+def saltos_em_bits(linhas, k, exato=False):
+    """
+    Calcula, para cada linha i, o conjunto de bits dos vértices alcançáveis
+    a partir de i com 1 a k saltos (ou exatamente k saltos no menor
+    caminho, se 'exato').
+
+    Passos:
+    1. Começar com alcance[i] = fronteira[i] = linhas[i] (1 salto). Com
+       'exato', o bit i entra no alcance desde o início (i está a 0
+       saltos de si mesmo), então i nunca aparece em uma fronteira.
+    2. A cada salto, a nova fronteira de i é o OR das linhas dos vértices
+       da fronteira atual, menos o que já foi alcançado. Cada OR processa
+       64 colunas por palavra da máquina, em vez de uma célula por vez.
+    3. Parar após k saltos ou quando todas as fronteiras esvaziarem (o
+       alcance já é o fecho transitivo).
+
+    Cada vértice entra na fronteira de i no máximo uma vez, então o custo
+    total é O(V² · V/64) operações de palavra, em vez do O(V³) de um laço
+    sobre 'vizinhos'.
+    """
+    if k < 1:
+        return [0] * len(linhas)
+
+    if exato:
+        fronteiras = [bits & ~(1 << i) for i, bits in enumerate(linhas)]
+        alcance = [bits | (1 << i) for i, bits in enumerate(linhas)]
+    else:
+        fronteiras = list(linhas)
+        alcance = list(linhas)
+
+    for _ in range(k - 1):
+        ativa = False
+        for i, fronteira in enumerate(fronteiras):
+            if not fronteira:
+                continue
+
+            proxima = 0
+            for j in _posicoes_bits(fronteira):
+                proxima |= linhas[j]
+            proxima &= ~alcance[i]
+
+            alcance[i] |= proxima
+            fronteiras[i] = proxima
+            ativa = ativa or proxima != 0
+
+        if not ativa:
+            break
+
+    return fronteiras if exato else alcance
+
+
+def vizinhanca_k(grafo, k, exato=False):
+    """
+    Retorna um dicionário vértice -> conjunto dos vértices alcançáveis com
+    1 a k saltos (ou exatamente a k saltos de distância, se 'exato').
+
+    Sem 'exato', o próprio vértice aparece no seu conjunto se estiver em um
+    ciclo de até k arestas; com 'exato' ele nunca aparece (sua distância é
+    0). Com k=2 e exato=True, são os "amigos de amigos" que não são amigos
+    diretos.
+    """
+    vertices, linhas = linhas_de_bits(grafo)
+    resultado = {}
+
+    for v, bits in zip(vertices, saltos_em_bits(linhas, k, exato)):
+        resultado[v] = {vertices[j] for j in _posicoes_bits(bits)}
+
+    return resultado
+
+
+def contagem_k(grafo, k, exato=False):
+    """
+    Retorna um dicionário vértice -> número de vértices alcançáveis com 1 a
+    k saltos (ou exatamente a k saltos, se 'exato'), contado com
+    int.bit_count() sobre o conjunto de bits, sem montar conjuntos de nomes.
+    """
+    vertices, linhas = linhas_de_bits(grafo)
+    return {v: bits.bit_count() for v, bits in zip(vertices, saltos_em_bits(linhas, k, exato))}
@@ -0,0 +1,139 @@
+from matriz import MatrizBits, _posicoes_bits
+
+
+def _vizinhancas(grafo):
+    """
+    Retorna (vertices, vizinhos): 'vizinhos[i]' é o conjunto de posições
+    ligadas a vertices[i] por uma aresta em qualquer sentido, sem laços.
+
+    A contagem de triângulos trata o grafo como não direcionado, então
+    sucessores e predecessores são juntados.
+    """
+    vertices = list(grafo)
+    indices = {v: i for i, v in enumerate(vertices)}
+    vizinhos = []
+
+    for i, v in enumerate(vertices):
+        conjunto = {indices[w] for w in grafo.iterar_vizinhos(v)}
+        conjunto.update(indices[w] for w in grafo.iterar_predecessores(v))
+        conjunto.discard(i)
+        vizinhos.append(conjunto)
+
+    return vertices, vizinhos
+
+
+def _triangulos_ordenados(vizinhos):
+    """
+    Conta os triângulos de cada posição por interseção com ordem de grau.
+
+    Passos:
+    1. Ordenar as posições por (grau, posição) e orientar cada aresta do
+       vértice de menor para o de maior ordem ('acima'). Cada vértice fica
+       com no máximo O(sqrt(E)) vizinhos acima.
+    2. Para cada aresta orientada u -> w, os triângulos que ela fecha são
+       acima[u] & acima[w] (interseção de conjuntos, percorrendo o menor):
+       cada triângulo é encontrado uma única vez, pelo seu vértice de
+       menor ordem.
+    3. Somar 1 para os três vértices de cada triângulo.
+
+    Custo O(E^1.5), em vez do O(Σ grau²) de testar todos os pares de vizinhos.
+    """
+    n = len(vizinhos)
+    ordem = sorted(range(n), key=lambda i: (len(vizinhos[i]), i))
+    posto = [0] * n
+    for p, i in enumerate(ordem):
+        posto[i] = p
+
+    acima = [{w for w in vizinhos[u] if posto[w] > posto[u]} for u in range(n)]
+    triangulos = [0] * n
+
+    for u in range(n):
+        acima_u = acima[u]
+        for w in acima_u:
+            comuns = acima_u & acima[w]
+            if comuns:
+                triangulos[u] += len(comuns)
+                triangulos[w] += len(comuns)
+                for x in comuns:
+                    triangulos[x] += 1
+
+    return triangulos
+
+
+def _triangulos_bits(grafo):
+    """
+    Conta os triângulos de cada vértice de uma 'MatrizBits'.
+
+    A vizinhança não direcionada de i é linhas[i] | colunas[i] (sem o bit
+    de i). Para cada vizinho j, os triângulos com a aresta i-j são os bits
+    ligados de viz[i] & viz[j] (AND de palavras inteiras + bit_count), e
+    cada triângulo de i é contado duas vezes (uma por vizinho).
+    """
+    vizinhos = [(linha | coluna) & ~(1 << i)
+                for i, (linha, coluna) in enumerate(zip(grafo.linhas, grafo.colunas))]
+    triangulos = []
+
+    for bits in vizinhos:
+        total = 0
+        for j in _posicoes_bits(bits):
+            total += (bits & vizinhos[j]).bit_count()
+        triangulos.append(total // 2)
+
+    return triangulos, [bits.bit_count() for bits in vizinhos]
+
+
+def _contagens(grafo):
+    """
+    Retorna (vertices, triangulos, graus), com o grau não direcionado de
+    cada vértice, escolhendo o método pela representação.
+    """
+    if isinstance(grafo, MatrizBits):
+        triangulos, graus = _triangulos_bits(grafo)
+        return grafo.vertices, triangulos, graus
+
+    vertices, vizinhos = _vizinhancas(grafo)
+    return vertices, _triangulos_ordenados(vizinhos), [len(c) for c in vizinhos]
+
+
+def triangulos_por_vertice(grafo):
+    """
+    Retorna um dicionário vértice -> número de triângulos que o contêm,
+    tratando as arestas como não direcionadas.
+    """
+    vertices, triangulos, _ = _contagens(grafo)
+    return dict(zip(vertices, triangulos))
+
+
+def contar_triangulos(grafo):
+    """
+    Retorna o número total de triângulos do grafo (cada triângulo é contado
+    uma vez, embora apareça em três vértices).
+    """
+    _, triangulos, _ = _contagens(grafo)
+    return sum(triangulos) // 3
+
+
+def coeficiente_agrupamento(grafo):
+    """
+    Retorna um dicionário vértice -> coeficiente de agrupamento local:
+    triângulos / pares de vizinhos, ou seja, 2T / (d(d - 1)). Vértices com
+    menos de dois vizinhos ficam com 0.0.
+    """
+    vertices, triangulos, graus = _contagens(grafo)
+    coeficientes = {}
+
+    for v, t, d in zip(vertices, triangulos, graus):
+        coeficientes[v] = 2 * t / (d * (d - 1)) if d > 1 else 0.0
+
+    return coeficientes
+
+
+def coeficiente_medio(grafo):
+    """
+    Retorna a média dos coeficientes de agrupamento locais (0.0 para grafo vazio).
+    """
+    coeficientes = coeficiente_agrupamento(grafo)
+    if not coeficientes:
+        return 0.0
+
+    return sum(coeficientes.values()) / len(coeficientes)
@@ -0,0 +1,61 @@
+class VistasVizinhos:
+    """
+    Cache das listas de vizinhos de um grafo, usado pelo método 'vizinhos'
+    das classes de grafo.
+
+    As chaves são os nomes dos vértices ou, nas classes que internam os
+    vértices, os seus ids. Cada chave tem um contador de versão
+    ('versoes'), incrementado pelo grafo sempre que os vizinhos de saída do
+    vértice mudam (inserir_aresta, remover_aresta, remover_vertice). A vista
+    guardada é uma tupla (somente leitura) acompanhada da versão em que foi
+    montada: se a versão ainda for a atual, a tupla é devolvida em O(1);
+    caso contrário, é montada de novo.
+    """
+
+    def __init__(self):
+        self.versoes = {}
+        self._vistas = {}
+
+    def alterar(self, vertice):
+        """
+        Marca os vizinhos de 'vertice' como alterados (nova versão).
+        """
+        self.versoes[vertice] = self.versoes.get(vertice, 0) + 1
+
+    def alterar_varios(self, vertices):
+        """
+        Marca os vizinhos de cada vértice de 'vertices' como alterados.
+        """
+        versoes = self.versoes
+        for vertice in vertices:
+            versoes[vertice] = versoes.get(vertice, 0) + 1
+
+    def remover(self, vertice, predecessores):
+        """
+        Descarta a vista de 'vertice' (que está sendo removido do grafo) e
+        marca como alterados os 'predecessores', que o tinham como vizinho.
+        """
+        self.alterar_varios(predecessores)
+        self.versoes.pop(vertice, None)
+        self._vistas.pop(vertice, None)
+
+    def obter(self, vertice, calcular):
+        """
+        Retorna a tupla de vizinhos de 'vertice', montando-a com
+        'calcular(vertice)' apenas se não houver vista da versão atual.
+        """
+        versao = self.versoes.get(vertice, 0)
+        guardada = self._vistas.get(vertice)
+        if guardada is not None and guardada[0] == versao:
+            return guardada[1]
+
+        vista = tuple(calcular(vertice))
+        self._vistas[vertice] = (versao, vista)
+        return vista
+
+    def limpar(self):
+        """
+        Descarta todas as vistas.
+        """
+        self.versoes.clear()
+        self._vistas.clear()